@@ -8,8 +8,18 @@
 import type { ToolInput, HandlerResult, HandlersMap, HandlerContext } from './types';
 import { errorResult } from './types';
 import type { KalshiCredentials } from '../../types';
-import { buildKalshiHeadersForUrl, type KalshiApiKeyAuth } from '../../utils/kalshi-auth';
+import {
+  buildKalshiHeadersForUrl,
+  notifyKalshiPortfolioWrite,
+  onKalshiPortfolioWrite,
+  type KalshiApiKeyAuth,
+} from '../../utils/kalshi-auth';
 import { enforceMaxOrderSize, enforceExposureLimits } from '../../trading/risk';
+import { mapWithConcurrency } from '../../utils/concurrency';
+import { createCache } from '../../cache';
+import { createLogger } from '../../utils/logger';
+
+const logger = createLogger('handlers:kalshi');
 
 // =============================================================================
 // CONSTANTS & HELPERS
@@ -17,6 +27,13 @@ import { enforceMaxOrderSize, enforceExposureLimits } from '../../trading/risk';
 
 const KALSHI_API_BASE = 'https://api.elections.kalshi.com/trade-api/v2';
 
+/** Max concurrent requests when a handler fans out over many items */
+const KALSHI_FANOUT_CONCURRENCY = 10;
+
+/** Shared header objects for unauthenticated calls (fetch does not mutate them) */
+const KALSHI_STATIC_HEADERS: Record<string, string> = {};
+const KALSHI_JSON_HEADERS: Record<string, string> = { 'Content-Type': 'application/json' };
+
 /**
  * Get Kalshi credentials from handler context
  */
@@ -35,24 +52,100 @@ function toApiKeyAuth(creds: KalshiCredentials): KalshiApiKeyAuth | null {
 }
 
 /**
- * Make an unauthenticated GET request to the Kalshi API
+ * Single fetch path for every Kalshi REST call in this module.
+ *
+ * All handlers go through here so they share Node's pooled keep-alive
+ * connections to the Kalshi host, build auth headers the same way, and
+ * get uniform latency/status instrumentation.
  */
-async function kalshiGet(path: string): Promise<string> {
+async function kalshiFetch(
+  method: string,
+  path: string,
+  options: { auth?: KalshiApiKeyAuth; body?: unknown } = {}
+): Promise<Response> {
   const url = `${KALSHI_API_BASE}${path}`;
+  // Kalshi signs timestamp + method + path, so auth headers are per request;
+  // everything else is shared or only added when there is a body.
+  let headers: Record<string, string> = KALSHI_STATIC_HEADERS;
+  if (options.auth) {
+    headers = buildKalshiHeadersForUrl(options.auth, method, url);
+    if (options.body !== undefined) headers['Content-Type'] = 'application/json';
+  } else if (options.body !== undefined) {
+    headers = KALSHI_JSON_HEADERS;
+  }
+  const fetchOptions: RequestInit = { method, headers };
+  if (options.body !== undefined) {
+    fetchOptions.body = JSON.stringify(options.body);
+  }
+  const startedAt = Date.now();
   try {
-    const response = await fetch(url, {
-      headers: { 'Content-Type': 'application/json' },
-    });
+    const response = await fetch(url, fetchOptions);
+    logger.debug({ method, path, status: response.status, ms: Date.now() - startedAt }, 'Kalshi request');
+    return response;
+  } catch (err) {
+    logger.debug({ method, path, ms: Date.now() - startedAt, error: (err as Error).message }, 'Kalshi request failed');
+    throw err;
+  }
+}
+
+/** In-flight GETs keyed by API key + path, shared by concurrent identical calls */
+const kalshiInflightGets = new Map<string, Promise<string>>();
+
+/**
+ * Make a Kalshi request and return the handler result string.
+ *
+ * Concurrent identical GETs (same path, same API key) share one round trip.
+ * Error bodies are drained so the socket is released back to the pool
+ * immediately instead of waiting on GC. Successful bodies are returned
+ * verbatim (they are already JSON).
+ */
+async function kalshiRequest(
+  method: string,
+  path: string,
+  options: { auth?: KalshiApiKeyAuth; body?: unknown } = {}
+): Promise<string> {
+  if (method !== 'GET') return sendKalshiRequest(method, path, options);
+
+  const key = `${options.auth?.apiKeyId ?? ''}|${path}`;
+  const inflight = kalshiInflightGets.get(key);
+  if (inflight) return inflight;
+  const request = sendKalshiRequest(method, path, options).finally(() => {
+    kalshiInflightGets.delete(key);
+  });
+  kalshiInflightGets.set(key, request);
+  return request;
+}
+
+/**
+ * Issue a single Kalshi request (no coalescing)
+ */
+async function sendKalshiRequest(
+  method: string,
+  path: string,
+  options: { auth?: KalshiApiKeyAuth; body?: unknown }
+): Promise<string> {
+  try {
+    const response = await kalshiFetch(method, path, options);
     if (!response.ok) {
+      await response.body?.cancel().catch(() => {});
       return JSON.stringify({ error: `Kalshi API error: ${response.status} ${response.statusText}` });
     }
-    const data = await response.json();
-    return JSON.stringify(data);
+    // Handler results are JSON strings already, so pass the body through
+    // instead of paying for a JSON.parse + JSON.stringify round-trip.
+    const text = await response.text();
+    return text || '{}';
   } catch (err: unknown) {
     return JSON.stringify({ error: (err as Error).message });
   }
 }
 
+/**
+ * Make an unauthenticated GET request to the Kalshi API
+ */
+async function kalshiGet(path: string): Promise<string> {
+  return kalshiRequest('GET', path);
+}
+
 /**
  * Make an authenticated request to the Kalshi API
  */
@@ -62,25 +155,87 @@ async function kalshiAuthFetch(
   path: string,
   body?: unknown
 ): Promise<string> {
-  const url = `${KALSHI_API_BASE}${path}`;
-  const headers = buildKalshiHeadersForUrl(auth, method, url);
-  const fetchOptions: RequestInit = {
-    method,
-    headers: { ...headers, 'Content-Type': 'application/json' },
-  };
-  if (body !== undefined) {
-    fetchOptions.body = JSON.stringify(body);
+  if (method === 'GET') return kalshiRequest(method, path, { auth, body });
+  const result = await kalshiRequest(method, path, { auth, body });
+  notifyKalshiPortfolioWrite(auth.apiKeyId);
+  return result;
+}
+
+/** TTLs for read-only endpoints whose data changes over minutes to days */
+const KALSHI_METADATA_TTL_MS = 15 * 60_000;
+const KALSHI_SLOW_TTL_MS = 60 * 60_000;
+
+/** Successful bodies of slow-moving public GETs, keyed by path */
+const kalshiResponseCache = createCache<string, string>({
+  name: 'kalshi-handler-responses',
+  maxSize: 500,
+  defaultTtl: KALSHI_METADATA_TTL_MS,
+});
+
+/**
+ * Unauthenticated GET served from a TTL cache. Only successful responses are
+ * stored, so a transient error never replaces a good cached body.
+ */
+async function kalshiGetCached(path: string, ttlMs: number = KALSHI_METADATA_TTL_MS): Promise<string> {
+  const cached = kalshiResponseCache.get(path);
+  if (cached !== undefined) return cached;
+  const result = await kalshiGet(path);
+  if (!result.startsWith('{"error"')) {
+    kalshiResponseCache.set(path, result, ttlMs);
   }
-  try {
-    const response = await fetch(url, fetchOptions);
-    if (!response.ok) {
-      return JSON.stringify({ error: `Kalshi API error: ${response.status} ${response.statusText}` });
-    }
-    const data = await response.json();
-    return JSON.stringify(data);
-  } catch (err: unknown) {
-    return JSON.stringify({ error: (err as Error).message });
+  return result;
+}
+
+/** Upper bound on how long a timestamp-guarded portfolio body may be reused */
+const KALSHI_USER_DATA_MAX_AGE_MS = 60_000;
+
+/** Portfolio bodies tagged with the user-data timestamp they were fetched at */
+const kalshiUserDataCache = createCache<string, { stamp: string; body: string }>({
+  name: 'kalshi-handler-user-data',
+  maxSize: 200,
+  defaultTtl: KALSHI_USER_DATA_MAX_AGE_MS,
+});
+
+// Orders placed or cancelled anywhere (execution service, skills, cron) drop
+// that account's cached bodies, even before its timestamp moves.
+onKalshiPortfolioWrite((apiKeyId) => {
+  const prefix = `${apiKeyId}:`;
+  for (const key of kalshiUserDataCache.keys()) {
+    if (key.startsWith(prefix)) kalshiUserDataCache.delete(key);
+  }
+});
+
+/**
+ * Authenticated portfolio GET gated on /portfolio/user-data/timestamp.
+ *
+ * Only for endpoints the timestamp covers (balance, positions, fills). The
+ * timestamp call is tiny; the heavier body is only re-fetched when the
+ * timestamp has moved since it was cached, so bots polling these endpoints
+ * on a timer mostly pay for the cheap check. The timestamp is read before the
+ * body so a cached body is never older than its tag. Falls back to a plain
+ * fetch if the timestamp call fails.
+ */
+async function kalshiAuthGetGuarded(auth: KalshiApiKeyAuth, path: string): Promise<string> {
+  const key = `${auth.apiKeyId}:${path}`;
+  const stamp = await kalshiAuthFetch(auth, 'GET', '/portfolio/user-data/timestamp');
+  const stampOk = !stamp.startsWith('{"error"');
+  if (stampOk) {
+    const cached = kalshiUserDataCache.get(key);
+    if (cached && cached.stamp === stamp) return cached.body;
+  }
+  const body = await kalshiAuthFetch(auth, 'GET', path);
+  if (stampOk && !body.startsWith('{"error"')) {
+    kalshiUserDataCache.set(key, { stamp, body });
   }
+  return body;
+}
+
+/**
+ * Append a query string to a path, omitting the `?` when there are no params
+ */
+function withQuery(path: string, params: URLSearchParams): string {
+  const qs = params.toString();
+  return qs ? `${path}?${qs}` : path;
 }
 
 /**
@@ -286,7 +441,7 @@ async function exchangeStatusHandler(_toolInput: ToolInput, _context: HandlerCon
  * kalshi_exchange_schedule - Get exchange schedule (no auth required)
  */
 async function exchangeScheduleHandler(_toolInput: ToolInput, _context: HandlerContext): Promise<HandlerResult> {
-  return kalshiGet('/exchange/schedule');
+  return kalshiGetCached('/exchange/schedule', KALSHI_SLOW_TTL_MS);
 }
 
 /**
@@ -306,7 +461,7 @@ async function announcementsHandler(_toolInput: ToolInput, _context: HandlerCont
 async function positionsHandler(_toolInput: ToolInput, context: HandlerContext): Promise<HandlerResult> {
   const auth = requireAuth(context);
   if (typeof auth === 'string') return auth;
-  return kalshiAuthFetch(auth, 'GET', '/portfolio/positions');
+  return kalshiAuthGetGuarded(auth, '/portfolio/positions');
 }
 
 /**
@@ -333,7 +488,7 @@ async function marketHandler(toolInput: ToolInput, _context: HandlerContext): Pr
 async function balanceHandler(_toolInput: ToolInput, context: HandlerContext): Promise<HandlerResult> {
   const auth = requireAuth(context);
   if (typeof auth === 'string') return auth;
-  return kalshiAuthFetch(auth, 'GET', '/portfolio/balance');
+  return kalshiAuthGetGuarded(auth, '/portfolio/balance');
 }
 
 /**
@@ -350,17 +505,11 @@ async function orderbookHandler(toolInput: ToolInput, _context: HandlerContext):
 async function marketTradesHandler(toolInput: ToolInput, _context: HandlerContext): Promise<HandlerResult> {
   const ticker = toolInput.ticker as string | undefined;
   const limit = toolInput.limit as number | undefined;
-  if (ticker) {
-    const params = new URLSearchParams();
-    if (limit) params.set('limit', String(limit));
-    const qs = params.toString();
-    return kalshiGet(`/markets/${encodeURIComponent(ticker)}/trades${qs ? `?${qs}` : ''}`);
-  }
-  // No ticker: list all trades
   const params = new URLSearchParams();
   if (limit) params.set('limit', String(limit));
-  const qs = params.toString();
-  return kalshiGet(`/markets/trades${qs ? `?${qs}` : ''}`);
+  // No ticker: list all trades
+  const path = ticker ? `/markets/${encodeURIComponent(ticker)}/trades` : '/markets/trades';
+  return kalshiGet(withQuery(path, params));
 }
 
 /**
@@ -384,8 +533,7 @@ async function eventsHandler(toolInput: ToolInput, _context: HandlerContext): Pr
   const params = new URLSearchParams();
   if (status) params.set('status', status);
   if (seriesTicker) params.set('series_ticker', seriesTicker);
-  const qs = params.toString();
-  return kalshiGet(`/events${qs ? `?${qs}` : ''}`);
+  return kalshiGet(withQuery('/events', params));
 }
 
 /**
@@ -403,8 +551,7 @@ async function seriesHandler(toolInput: ToolInput, _context: HandlerContext): Pr
   const category = toolInput.category as string | undefined;
   const params = new URLSearchParams();
   if (category) params.set('category', category);
-  const qs = params.toString();
-  return kalshiGet(`/series${qs ? `?${qs}` : ''}`);
+  return kalshiGet(withQuery('/series', params));
 }
 
 /**
@@ -578,8 +725,7 @@ async function fillsHandler(toolInput: ToolInput, context: HandlerContext): Prom
   const params = new URLSearchParams();
   if (ticker) params.set('ticker', ticker);
   if (limit) params.set('limit', String(limit));
-  const qs = params.toString();
-  return kalshiAuthFetch(auth, 'GET', `/portfolio/fills${qs ? `?${qs}` : ''}`);
+  return kalshiAuthGetGuarded(auth, withQuery('/portfolio/fills', params));
 }
 
 /**
@@ -591,8 +737,7 @@ async function settlementsHandler(toolInput: ToolInput, context: HandlerContext)
   const limit = toolInput.limit as number | undefined;
   const params = new URLSearchParams();
   if (limit) params.set('limit', String(limit));
-  const qs = params.toString();
-  return kalshiAuthFetch(auth, 'GET', `/portfolio/settlements${qs ? `?${qs}` : ''}`);
+  return kalshiAuthFetch(auth, 'GET', withQuery('/portfolio/settlements', params));
 }
 
 /**
@@ -636,7 +781,7 @@ async function deleteApiKeyHandler(toolInput: ToolInput, context: HandlerContext
  * kalshi_fee_changes - Get fee changes
  */
 async function feeChangesHandler(_toolInput: ToolInput, _context: HandlerContext): Promise<HandlerResult> {
-  return kalshiGet('/exchange/fee-changes');
+  return kalshiGetCached('/exchange/fee-changes', KALSHI_SLOW_TTL_MS);
 }
 
 /**
@@ -653,21 +798,25 @@ async function userDataTimestampHandler(_toolInput: ToolInput, context: HandlerC
  */
 async function batchCandlesticksHandler(toolInput: ToolInput, _context: HandlerContext): Promise<HandlerResult> {
   const tickers = toolInput.tickers as unknown[];
-  // Fetch candlesticks for each ticker in parallel
+  // Fetch candlesticks for each ticker in parallel (bounded). Candle payloads can be
+  // large, so each body is spliced into the result as-is rather than decoded and re-encoded.
   try {
-    const results = await Promise.all(
-      (tickers as Array<{ ticker: string; series_ticker: string; interval?: number }>).map(async (t) => {
+    const results = await mapWithConcurrency(
+      tickers as Array<{ ticker: string; series_ticker: string; interval?: number }>,
+      KALSHI_FANOUT_CONCURRENCY,
+      async (t) => {
         const params = new URLSearchParams({ series_ticker: t.series_ticker });
         if (t.interval) params.set('period_interval', String(t.interval));
-        const url = `${KALSHI_API_BASE}/markets/${encodeURIComponent(t.ticker)}/candlesticks?${params.toString()}`;
-        const response = await fetch(url, { headers: { 'Content-Type': 'application/json' } });
+        const response = await kalshiFetch('GET', `/markets/${encodeURIComponent(t.ticker)}/candlesticks?${params.toString()}`);
         if (!response.ok) {
-          return { ticker: t.ticker, error: `Kalshi API error: ${response.status} ${response.statusText}` };
+          await response.body?.cancel().catch(() => {});
+          return JSON.stringify({ ticker: t.ticker, error: `Kalshi API error: ${response.status} ${response.statusText}` });
         }
-        return { ticker: t.ticker, data: await response.json() };
-      })
+        const body = await response.text();
+        return `{"ticker":${JSON.stringify(t.ticker)},"data":${body || 'null'}}`;
+      }
     );
-    return JSON.stringify(results);
+    return `[${results.join(',')}]`;
   } catch (err: unknown) {
     return JSON.stringify({ error: (err as Error).message });
   }
@@ -678,7 +827,7 @@ async function batchCandlesticksHandler(toolInput: ToolInput, _context: HandlerC
  */
 async function eventMetadataHandler(toolInput: ToolInput, _context: HandlerContext): Promise<HandlerResult> {
   const eventTicker = toolInput.event_ticker as string;
-  return kalshiGet(`/events/${encodeURIComponent(eventTicker)}/metadata`);
+  return kalshiGetCached(`/events/${encodeURIComponent(eventTicker)}/metadata`);
 }
 
 /**
@@ -689,8 +838,7 @@ async function eventCandlesticksHandler(toolInput: ToolInput, _context: HandlerC
   const interval = toolInput.interval as number | undefined;
   const params = new URLSearchParams();
   if (interval) params.set('period_interval', String(interval));
-  const qs = params.toString();
-  return kalshiGet(`/events/${encodeURIComponent(eventTicker)}/candlesticks${qs ? `?${qs}` : ''}`);
+  return kalshiGet(withQuery(`/events/${encodeURIComponent(eventTicker)}/candlesticks`, params));
 }
 
 /**
@@ -954,7 +1102,7 @@ async function confirmQuoteHandler(toolInput: ToolInput, context: HandlerContext
  * kalshi_collections - List collections
  */
 async function collectionsHandler(_toolInput: ToolInput, _context: HandlerContext): Promise<HandlerResult> {
-  return kalshiGet('/collections');
+  return kalshiGetCached('/collections');
 }
 
 /**
@@ -962,7 +1110,7 @@ async function collectionsHandler(_toolInput: ToolInput, _context: HandlerContex
  */
 async function collectionHandler(toolInput: ToolInput, _context: HandlerContext): Promise<HandlerResult> {
   const collectionTicker = toolInput.collection_ticker as string;
-  return kalshiGet(`/collections/${encodeURIComponent(collectionTicker)}`);
+  return kalshiGetCached(`/collections/${encodeURIComponent(collectionTicker)}`);
 }
 
 /**
@@ -970,7 +1118,7 @@ async function collectionHandler(toolInput: ToolInput, _context: HandlerContext)
  */
 async function collectionLookupHandler(toolInput: ToolInput, _context: HandlerContext): Promise<HandlerResult> {
   const collectionTicker = toolInput.collection_ticker as string;
-  return kalshiGet(`/collections/${encodeURIComponent(collectionTicker)}/lookup`);
+  return kalshiGetCached(`/collections/${encodeURIComponent(collectionTicker)}/lookup`);
 }
 
 /**
@@ -995,28 +1143,14 @@ async function liveDataHandler(toolInput: ToolInput, _context: HandlerContext):
  */
 async function liveDataBatchHandler(toolInput: ToolInput, _context: HandlerContext): Promise<HandlerResult> {
   const requests = toolInput.requests as unknown[];
-  const url = `${KALSHI_API_BASE}/live-data/batch`;
-  try {
-    const response = await fetch(url, {
-      method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({ requests }),
-    });
-    if (!response.ok) {
-      return JSON.stringify({ error: `Kalshi API error: ${response.status} ${response.statusText}` });
-    }
-    const data = await response.json();
-    return JSON.stringify(data);
-  } catch (err: unknown) {
-    return JSON.stringify({ error: (err as Error).message });
-  }
+  return kalshiRequest('POST', '/live-data/batch', { body: { requests } });
 }
 
 /**
  * kalshi_milestones - List milestones
  */
 async function milestonesHandler(_toolInput: ToolInput, _context: HandlerContext): Promise<HandlerResult> {
-  return kalshiGet('/milestones');
+  return kalshiGetCached('/milestones');
 }
 
 /**
@@ -1024,14 +1158,14 @@ async function milestonesHandler(_toolInput: ToolInput, _context: HandlerContext
  */
 async function milestoneHandler(toolInput: ToolInput, _context: HandlerContext): Promise<HandlerResult> {
   const milestoneId = toolInput.milestone_id as string;
-  return kalshiGet(`/milestones/${encodeURIComponent(milestoneId)}`);
+  return kalshiGetCached(`/milestones/${encodeURIComponent(milestoneId)}`);
 }
 
 /**
  * kalshi_structured_targets - List structured targets
  */
 async function structuredTargetsHandler(_toolInput: ToolInput, _context: HandlerContext): Promise<HandlerResult> {
-  return kalshiGet('/structured-targets');
+  return kalshiGetCached('/structured-targets');
 }
 
 /**
@@ -1039,14 +1173,14 @@ async function structuredTargetsHandler(_toolInput: ToolInput, _context: Handler
  */
 async function structuredTargetHandler(toolInput: ToolInput, _context: HandlerContext): Promise<HandlerResult> {
   const targetId = toolInput.target_id as string;
-  return kalshiGet(`/structured-targets/${encodeURIComponent(targetId)}`);
+  return kalshiGetCached(`/structured-targets/${encodeURIComponent(targetId)}`);
 }
 
 /**
  * kalshi_incentives - Get incentives
  */
 async function incentivesHandler(_toolInput: ToolInput, _context: HandlerContext): Promise<HandlerResult> {
-  return kalshiGet('/incentives');
+  return kalshiGetCached('/incentives', KALSHI_SLOW_TTL_MS);
 }
 
 /**
@@ -1071,14 +1205,14 @@ async function fcmPositionsHandler(_toolInput: ToolInput, context: HandlerContex
  * kalshi_search_tags - Search by tags
  */
 async function searchTagsHandler(_toolInput: ToolInput, _context: HandlerContext): Promise<HandlerResult> {
-  return kalshiGet('/markets/search/tags');
+  return kalshiGetCached('/markets/search/tags');
 }
 
 /**
  * kalshi_search_sports - Search sports markets
  */
 async function searchSportsHandler(_toolInput: ToolInput, _context: HandlerContext): Promise<HandlerResult> {
-  return kalshiGet('/markets/search/sports');
+  return kalshiGetCached('/markets/search/sports');
 }
 
 // =============================================================================
@@ -79,6 +79,8 @@ async function healthHandler(
 ): Promise<HandlerResult> {
   return safeHandler(async () => {
     const response = await fetchClob(context, 'https://clob.polymarket.com/');
+    // Only the status matters; release the socket instead of leaving the body unread
+    await response.body?.cancel().catch(() => {});
     return { ok: response.ok, status: response.status };
   });
 }
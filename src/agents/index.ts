@@ -157,7 +157,16 @@ import { getMeteoraDlmmQuote } from '../solana/meteora';
 import { wormholeQuote, wormholeBridge, wormholeRedeem, usdcBridgeAuto, usdcQuoteAuto } from '../bridge/wormhole';
 import { isRetryableError, withRetry, RETRY_POLICIES } from '../infra/retry';
 import { createMarketIndexService, MarketIndexService } from '../market-index';
-import { enforceExposureLimits, enforceMaxOrderSize } from '../trading/risk';
+import { enforceExposureLimits, enforceMaxOrderSize, validatePolymarketBatchOrders } from '../trading/risk';
+import { mapWithConcurrency } from '../utils/concurrency';
+import { createCache } from '../cache';
+import {
+  fetchPolymarketPublicCached,
+  POLYMARKET_LEADERBOARD_TTL_MS,
+  POLYMARKET_LIVE_STATS_TTL_MS,
+  POLYMARKET_PROFILE_TTL_MS,
+  POLYMARKET_RANK_TTL_MS,
+} from '../utils/polymarket-public-cache';
 // binanceFutures — migrated to handlers/binance.ts
 // bybit — migrated to handlers/bybit.ts
 import * as mexc from '../exchanges/mexc';
@@ -478,6 +487,27 @@ async function extractMemoryWithClaude(
   return safeParseJsonObject<MemoryExtractionResult>(raw);
 }
 
+/** 0x-prefixed 20-byte hex address; checked before wallet-keyed Data API calls */
+const EVM_ADDRESS_RE = /^0x[a-fA-F0-9]{40}$/;
+
+/** Max concurrent CLOB requests when a batch tool fans out per token */
+const POLYMARKET_FANOUT_CONCURRENCY = 16;
+
+/**
+ * TTLs for per-token CLOB metadata. Neg-risk is fixed per market; fee rates
+ * change rarely; tick size can step when price nears 0 or 1, so it stays short.
+ */
+const POLYMARKET_NEG_RISK_TTL_MS = 60 * 60_000;
+const POLYMARKET_FEE_RATE_TTL_MS = 5 * 60_000;
+const POLYMARKET_TICK_SIZE_TTL_MS = 60_000;
+
+/** Successful CLOB metadata bodies, keyed by URL */
+const polymarketTokenMetaCache = createCache<string, ApiResponse>({
+  name: 'polymarket-token-meta',
+  maxSize: 5000,
+  defaultTtl: POLYMARKET_TICK_SIZE_TTL_MS,
+});
+
 async function fetchPolymarketClob(
   context: AgentContext,
   url: string,
@@ -496,6 +526,38 @@ async function fetchPolymarketClob(
   });
 }
 
+/**
+ * GET a CLOB endpoint and decode its JSON body. On a non-OK response the body
+ * is drained, `data` is null and `status` carries the HTTP status.
+ */
+async function fetchPolymarketClobJson<T = ApiResponse>(
+  context: AgentContext,
+  url: string
+): Promise<{ status: number; data: T | null }> {
+  const response = await fetchPolymarketClob(context, url);
+  if (!response.ok) {
+    await response.body?.cancel().catch(() => {});
+    return { status: response.status, data: null };
+  }
+  return { status: response.status, data: await response.json() as T };
+}
+
+/**
+ * fetchPolymarketClobJson through a TTL cache; only OK responses are cached.
+ */
+async function fetchPolymarketTokenMeta(
+  context: AgentContext,
+  url: string,
+  ttlMs: number
+): Promise<{ status: number; data: ApiResponse | null }> {
+  const cached = polymarketTokenMetaCache.get(url);
+  if (cached) return { status: 200, data: cached };
+
+  const result = await fetchPolymarketClobJson(context, url);
+  if (result.data) polymarketTokenMetaCache.set(url, result.data, ttlMs);
+  return result;
+}
+
 async function driftGatewayRequest(
   method: 'GET' | 'POST' | 'PATCH' | 'DELETE',
   path: string,
@@ -10655,11 +10717,15 @@ async function executeTool(
         const tokenId = toolInput.token_id as string;
 
         try {
-          const response = await fetchPolymarketClob(context, `https://clob.polymarket.com/fee-rate?token_id=${tokenId}`);
-          if (!response.ok) {
-            return JSON.stringify({ error: `Failed to get fee rate: ${response.status}` });
+          const { status, data: feeData } = await fetchPolymarketTokenMeta(
+            context,
+            `https://clob.polymarket.com/fee-rate?token_id=${tokenId}`,
+            POLYMARKET_FEE_RATE_TTL_MS
+          );
+          if (!feeData) {
+            return JSON.stringify({ error: `Failed to get fee rate: ${status}` });
           }
-          const data = await response.json() as { fee_rate_bps?: number; base_fee?: number };
+          const data = feeData as { fee_rate_bps?: number; base_fee?: number };
           const feeRateBps = data.fee_rate_bps || data.base_fee || 0;
           const hasFeesMessage = feeRateBps > 0
             ? `This market has FEES. Taker fee: ~${(feeRateBps / 100).toFixed(1)}% base rate. Use maker_buy/maker_sell to avoid fees.`
@@ -10682,11 +10748,13 @@ async function executeTool(
         const tokenId = toolInput.token_id as string;
 
         try {
-          const response = await fetchPolymarketClob(context, `https://clob.polymarket.com/midpoint?token_id=${tokenId}`);
-          if (!response.ok) {
-            return JSON.stringify({ error: `Failed to get midpoint: ${response.status}` });
+          const { status, data } = await fetchPolymarketClobJson<{ mid?: string }>(
+            context,
+            `https://clob.polymarket.com/midpoint?token_id=${tokenId}`
+          );
+          if (!data) {
+            return JSON.stringify({ error: `Failed to get midpoint: ${status}` });
           }
-          const data = await response.json() as { mid?: string };
           return JSON.stringify({
             token_id: tokenId,
             midpoint: data.mid,
@@ -10703,16 +10771,19 @@ async function executeTool(
         const tokenId = toolInput.token_id as string;
 
         try {
-          const response = await fetchPolymarketClob(context, `https://clob.polymarket.com/spread?token_id=${tokenId}`);
-          if (!response.ok) {
-            return JSON.stringify({ error: `Failed to get spread: ${response.status}` });
+          const { status, data } = await fetchPolymarketClobJson<{ spread?: string }>(
+            context,
+            `https://clob.polymarket.com/spread?token_id=${tokenId}`
+          );
+          if (!data) {
+            return JSON.stringify({ error: `Failed to get spread: ${status}` });
           }
-          const data = await response.json() as { spread?: string };
+          const spreadPct = (parseFloat(data.spread || '0') * 100).toFixed(2);
           return JSON.stringify({
             token_id: tokenId,
             spread: data.spread,
-            spread_pct: (parseFloat(data.spread || '0') * 100).toFixed(2) + '%',
-            message: `Bid-ask spread: ${(parseFloat(data.spread || '0') * 100).toFixed(2)}%`,
+            spread_pct: spreadPct + '%',
+            message: `Bid-ask spread: ${spreadPct}%`,
           });
         } catch (err: unknown) {
           const error = err as { message?: string };
@@ -10725,11 +10796,13 @@ async function executeTool(
         const tokenId = toolInput.token_id as string;
 
         try {
-          const response = await fetchPolymarketClob(context, `https://clob.polymarket.com/last-trade-price?token_id=${tokenId}`);
-          if (!response.ok) {
-            return JSON.stringify({ error: `Failed to get last trade: ${response.status}` });
+          const { status, data } = await fetchPolymarketClobJson<{ price?: string }>(
+            context,
+            `https://clob.polymarket.com/last-trade-price?token_id=${tokenId}`
+          );
+          if (!data) {
+            return JSON.stringify({ error: `Failed to get last trade: ${status}` });
           }
-          const data = await response.json() as { price?: string };
           return JSON.stringify({
             token_id: tokenId,
             last_trade_price: data.price,
@@ -10746,11 +10819,14 @@ async function executeTool(
         const tokenId = toolInput.token_id as string;
 
         try {
-          const response = await fetchPolymarketClob(context, `https://clob.polymarket.com/tick-size?token_id=${tokenId}`);
-          if (!response.ok) {
-            return JSON.stringify({ error: `Failed to get tick size: ${response.status}` });
+          const { status, data } = await fetchPolymarketTokenMeta(
+            context,
+            `https://clob.polymarket.com/tick-size?token_id=${tokenId}`,
+            POLYMARKET_TICK_SIZE_TTL_MS
+          );
+          if (!data) {
+            return JSON.stringify({ error: `Failed to get tick size: ${status}` });
           }
-          const data = await response.json() as ApiResponse;
           return JSON.stringify({
             token_id: tokenId,
             tick_size: data.minimum_tick_size,
@@ -10939,6 +11015,8 @@ async function executeTool(
       case 'polymarket_health': {
         try {
           const response = await fetchPolymarketClob(context, 'https://clob.polymarket.com/');
+          // Only the status matters; release the socket instead of leaving the body unread
+          await response.body?.cancel().catch(() => {});
           return JSON.stringify({ ok: response.ok, status: response.status });
         } catch (err: unknown) {
           return JSON.stringify({ ok: false, error: (err as Error).message });
@@ -10984,8 +11062,13 @@ async function executeTool(
         const tokenId = toolInput.token_id as string;
         const side = toolInput.side as string;
         try {
-          const response = await fetchPolymarketClob(context, `https://clob.polymarket.com/price?token_id=${tokenId}&side=${side}`);
-          const data = await response.json() as ApiResponse;
+          const { status, data } = await fetchPolymarketClobJson<{ price?: string }>(
+            context,
+            `https://clob.polymarket.com/price?token_id=${tokenId}&side=${side}`
+          );
+          if (!data) {
+            return JSON.stringify({ error: `Failed to get price: ${status}` });
+          }
           return JSON.stringify({ token_id: tokenId, side, price: data.price });
         } catch (err: unknown) {
           return JSON.stringify({ error: (err as Error).message });
@@ -10996,8 +11079,14 @@ async function executeTool(
         const tokenId = toolInput.token_id as string;
         try {
           const negRiskParams = new URLSearchParams({ token_id: tokenId });
-          const response = await fetchPolymarketClob(context, `https://clob.polymarket.com/neg-risk?${negRiskParams}`);
-          const data = await response.json() as ApiResponse;
+          const { status, data } = await fetchPolymarketTokenMeta(
+            context,
+            `https://clob.polymarket.com/neg-risk?${negRiskParams}`,
+            POLYMARKET_NEG_RISK_TTL_MS
+          );
+          if (!data) {
+            return JSON.stringify({ error: `Failed to get neg risk: ${status}` });
+          }
           return JSON.stringify({ token_id: tokenId, neg_risk: data.neg_risk });
         } catch (err: unknown) {
           return JSON.stringify({ error: (err as Error).message });
@@ -11008,12 +11097,14 @@ async function executeTool(
       case 'polymarket_midpoints_batch': {
         const tokenIds = toolInput.token_ids as string[];
         try {
-          const results = await Promise.all(tokenIds.map(async (id) => {
+          const results = await mapWithConcurrency(tokenIds, POLYMARKET_FANOUT_CONCURRENCY, async (id) => {
             const params = new URLSearchParams({ token_id: id });
-            const r = await fetch(`https://clob.polymarket.com/midpoint?${params}`);
-            const d = await r.json() as { mid?: string };
-            return { token_id: id, mid: d.mid };
-          }));
+            const { status, data } = await fetchPolymarketClobJson<{ mid?: string }>(
+              context,
+              `https://clob.polymarket.com/midpoint?${params}`
+            );
+            return data ? { token_id: id, mid: data.mid } : { token_id: id, error: `HTTP ${status}` };
+          });
           return JSON.stringify(results);
         } catch (err: unknown) {
           return JSON.stringify({ error: (err as Error).message });
@@ -11023,12 +11114,16 @@ async function executeTool(
       case 'polymarket_prices_batch': {
         const requests = toolInput.requests as Array<{ token_id: string; side: string }>;
         try {
-          const results = await Promise.all(requests.map(async (req) => {
+          const results = await mapWithConcurrency(requests, POLYMARKET_FANOUT_CONCURRENCY, async (req) => {
             const params = new URLSearchParams({ token_id: req.token_id, side: req.side });
-            const r = await fetch(`https://clob.polymarket.com/price?${params}`);
-            const d = await r.json() as { price?: string };
-            return { token_id: req.token_id, side: req.side, price: d.price };
-          }));
+            const { status, data } = await fetchPolymarketClobJson<{ price?: string }>(
+              context,
+              `https://clob.polymarket.com/price?${params}`
+            );
+            return data
+              ? { token_id: req.token_id, side: req.side, price: data.price }
+              : { token_id: req.token_id, side: req.side, error: `HTTP ${status}` };
+          });
           return JSON.stringify(results);
         } catch (err: unknown) {
           return JSON.stringify({ error: (err as Error).message });
@@ -11038,12 +11133,14 @@ async function executeTool(
       case 'polymarket_spreads_batch': {
         const tokenIds = toolInput.token_ids as string[];
         try {
-          const results = await Promise.all(tokenIds.map(async (id) => {
+          const results = await mapWithConcurrency(tokenIds, POLYMARKET_FANOUT_CONCURRENCY, async (id) => {
             const params = new URLSearchParams({ token_id: id });
-            const r = await fetch(`https://clob.polymarket.com/spread?${params}`);
-            const d = await r.json() as { spread?: string };
-            return { token_id: id, spread: d.spread };
-          }));
+            const { status, data } = await fetchPolymarketClobJson<{ spread?: string }>(
+              context,
+              `https://clob.polymarket.com/spread?${params}`
+            );
+            return data ? { token_id: id, spread: data.spread } : { token_id: id, error: `HTTP ${status}` };
+          });
           return JSON.stringify(results);
         } catch (err: unknown) {
           return JSON.stringify({ error: (err as Error).message });
@@ -11053,12 +11150,15 @@ async function executeTool(
       case 'polymarket_orderbooks_batch': {
         const tokenIds = toolInput.token_ids as string[];
         try {
-          const results = await Promise.all(tokenIds.map(async (id) => {
+          const results = await mapWithConcurrency(tokenIds, POLYMARKET_FANOUT_CONCURRENCY, async (id) => {
             const params = new URLSearchParams({ token_id: id });
-            const r = await fetch(`https://clob.polymarket.com/book?${params}`);
-            const d = await r.json() as { bids?: Array<{ price: string; size: string }>; asks?: Array<{ price: string; size: string }> };
-            return { token_id: id, bids: (d.bids || []).slice(0, 5), asks: (d.asks || []).slice(0, 5) };
-          }));
+            const { status, data } = await fetchPolymarketClobJson<{
+              bids?: Array<{ price: string; size: string }>;
+              asks?: Array<{ price: string; size: string }>;
+            }>(context, `https://clob.polymarket.com/book?${params}`);
+            if (!data) return { token_id: id, error: `HTTP ${status}` };
+            return { token_id: id, bids: (data.bids || []).slice(0, 5), asks: (data.asks || []).slice(0, 5) };
+          });
           return JSON.stringify(results);
         } catch (err: unknown) {
           return JSON.stringify({ error: (err as Error).message });
@@ -11068,12 +11168,14 @@ async function executeTool(
       case 'polymarket_last_trades_batch': {
         const tokenIds = toolInput.token_ids as string[];
         try {
-          const results = await Promise.all(tokenIds.map(async (id) => {
+          const results = await mapWithConcurrency(tokenIds, POLYMARKET_FANOUT_CONCURRENCY, async (id) => {
             const params = new URLSearchParams({ token_id: id });
-            const r = await fetch(`https://clob.polymarket.com/last-trade-price?${params}`);
-            const d = await r.json() as { price?: string };
-            return { token_id: id, price: d.price };
-          }));
+            const { status, data } = await fetchPolymarketClobJson<{ price?: string }>(
+              context,
+              `https://clob.polymarket.com/last-trade-price?${params}`
+            );
+            return data ? { token_id: id, price: data.price } : { token_id: id, error: `HTTP ${status}` };
+          });
           return JSON.stringify(results);
         } catch (err: unknown) {
           return JSON.stringify({ error: (err as Error).message });
@@ -11193,31 +11295,28 @@ async function executeTool(
           return JSON.stringify({ error: 'No Polymarket credentials set up.' });
         }
         const orders = toolInput.orders as Array<{ token_id: string; price: number; size: number; side: string }>;
-        if (Array.isArray(orders) && orders.length > 0) {
-          let total = 0;
-          const perToken = new Map<string, number>();
-          for (const order of orders) {
-            if (!order) continue;
-            const side = String(order.side || '').toUpperCase();
-            if (side && side !== 'BUY') continue;
-            const price = Number(order.price);
-            const size = Number(order.size);
-            if (!Number.isFinite(price) || !Number.isFinite(size)) continue;
-            const notional = price * size;
-            total += notional;
-            perToken.set(order.token_id, (perToken.get(order.token_id) || 0) + notional);
-          }
-          const maxError = enforceMaxOrderSize(context, total, 'polymarket_post_orders_batch');
-          if (maxError) return maxError;
-          for (const [tokenId, notional] of perToken) {
-            const exposureError = enforceExposureLimits(context, userId, {
-              platform: 'polymarket',
-              outcomeId: tokenId,
-              notional,
-              label: 'polymarket_post_orders_batch',
-            });
-            if (exposureError) return exposureError;
-          }
+        // Reject malformed orders up front, before exposure checks or any signing
+        const invalidOrder = validatePolymarketBatchOrders(orders);
+        if (invalidOrder) return invalidOrder;
+
+        let total = 0;
+        const perToken = new Map<string, number>();
+        for (const order of orders) {
+          if (String(order.side).toUpperCase() !== 'BUY') continue;
+          const notional = Number(order.price) * Number(order.size);
+          total += notional;
+          perToken.set(order.token_id, (perToken.get(order.token_id) || 0) + notional);
+        }
+        const maxError = enforceMaxOrderSize(context, total, 'polymarket_post_orders_batch');
+        if (maxError) return maxError;
+        for (const [tokenId, notional] of perToken) {
+          const exposureError = enforceExposureLimits(context, userId, {
+            platform: 'polymarket',
+            outcomeId: tokenId,
+            notional,
+            label: 'polymarket_post_orders_batch',
+          });
+          if (exposureError) return exposureError;
         }
         const execSvc = context.tradingContext?.executionService;
         if (execSvc) {
@@ -11461,8 +11560,7 @@ async function executeTool(
       case 'polymarket_event': {
         const eventId = toolInput.event_id as string;
         try {
-          const response = await fetch(`https://gamma-api.polymarket.com/events/${encodeURIComponent(eventId)}`);
-          const data = await response.json() as ApiResponse;
+          const data = await fetchPolymarketPublicCached(`https://gamma-api.polymarket.com/events/${encodeURIComponent(eventId)}`);
           return JSON.stringify(data);
         } catch (err: unknown) {
           return JSON.stringify({ error: (err as Error).message });
@@ -11472,8 +11570,7 @@ async function executeTool(
       case 'polymarket_event_by_slug': {
         const slug = toolInput.slug as string;
         try {
-          const response = await fetch(`https://gamma-api.polymarket.com/events?slug=${encodeURIComponent(slug)}`);
-          const data = await response.json() as ApiResponse;
+          const data = await fetchPolymarketPublicCached(`https://gamma-api.polymarket.com/events?slug=${encodeURIComponent(slug)}`);
           return JSON.stringify(data);
         } catch (err: unknown) {
           return JSON.stringify({ error: (err as Error).message });
@@ -11683,8 +11780,7 @@ async function executeTool(
       case 'polymarket_event_tags': {
         const eventId = toolInput.event_id as string;
         try {
-          const response = await fetch(`https://gamma-api.polymarket.com/events/${encodeURIComponent(eventId)}/tags`);
-          const data = await response.json() as ApiResponse;
+          const data = await fetchPolymarketPublicCached(`https://gamma-api.polymarket.com/events/${encodeURIComponent(eventId)}/tags`);
           return JSON.stringify(data);
         } catch (err: unknown) {
           return JSON.stringify({ error: (err as Error).message });
@@ -11694,8 +11790,7 @@ async function executeTool(
       case 'polymarket_market_by_slug': {
         const slug = toolInput.slug as string;
         try {
-          const response = await fetch(`https://gamma-api.polymarket.com/markets?slug=${encodeURIComponent(slug)}`);
-          const data = await response.json() as ApiResponse;
+          const data = await fetchPolymarketPublicCached(`https://gamma-api.polymarket.com/markets?slug=${encodeURIComponent(slug)}`);
           return JSON.stringify(data);
         } catch (err: unknown) {
           return JSON.stringify({ error: (err as Error).message });
@@ -11705,8 +11800,7 @@ async function executeTool(
       case 'polymarket_market_tags': {
         const marketId = toolInput.market_id as string;
         try {
-          const response = await fetch(`https://gamma-api.polymarket.com/markets/${encodeURIComponent(marketId)}/tags`);
-          const data = await response.json() as ApiResponse;
+          const data = await fetchPolymarketPublicCached(`https://gamma-api.polymarket.com/markets/${encodeURIComponent(marketId)}/tags`);
           return JSON.stringify(data);
         } catch (err: unknown) {
           return JSON.stringify({ error: (err as Error).message });
@@ -11723,8 +11817,7 @@ async function executeTool(
           const url = seriesId
             ? `https://gamma-api.polymarket.com/series/${encodeURIComponent(seriesId)}`
             : 'https://gamma-api.polymarket.com/series';
-          const response = await fetch(url);
-          const data = await response.json() as ApiResponse;
+          const data = await fetchPolymarketPublicCached(url);
           return JSON.stringify(data);
         } catch (err: unknown) {
           return JSON.stringify({ error: (err as Error).message });
@@ -11734,8 +11827,7 @@ async function executeTool(
       case 'polymarket_series_list': {
         const limit = (toolInput.limit as number) || 20;
         try {
-          const response = await fetch(`https://gamma-api.polymarket.com/series?_limit=${limit}`);
-          const data = await response.json() as ApiResponse;
+          const data = await fetchPolymarketPublicCached(`https://gamma-api.polymarket.com/series?_limit=${limit}`);
           return JSON.stringify(data);
         } catch (err: unknown) {
           return JSON.stringify({ error: (err as Error).message });
@@ -11749,8 +11841,7 @@ async function executeTool(
       case 'polymarket_tags': {
         const limit = (toolInput.limit as number) || 50;
         try {
-          const response = await fetch(`https://gamma-api.polymarket.com/tags?_limit=${limit}`);
-          const data = await response.json() as ApiResponse;
+          const data = await fetchPolymarketPublicCached(`https://gamma-api.polymarket.com/tags?_limit=${limit}`);
           return JSON.stringify(data);
         } catch (err: unknown) {
           return JSON.stringify({ error: (err as Error).message });
@@ -11760,8 +11851,7 @@ async function executeTool(
       case 'polymarket_tag': {
         const tagId = toolInput.tag_id as string;
         try {
-          const response = await fetch(`https://gamma-api.polymarket.com/tags/${encodeURIComponent(tagId)}`);
-          const data = await response.json() as ApiResponse;
+          const data = await fetchPolymarketPublicCached(`https://gamma-api.polymarket.com/tags/${encodeURIComponent(tagId)}`);
           return JSON.stringify(data);
         } catch (err: unknown) {
           return JSON.stringify({ error: (err as Error).message });
@@ -11771,8 +11861,7 @@ async function executeTool(
       case 'polymarket_tag_by_slug': {
         const slug = toolInput.slug as string;
         try {
-          const response = await fetch(`https://gamma-api.polymarket.com/tags?slug=${encodeURIComponent(slug)}`);
-          const data = await response.json() as ApiResponse;
+          const data = await fetchPolymarketPublicCached(`https://gamma-api.polymarket.com/tags?slug=${encodeURIComponent(slug)}`);
           return JSON.stringify(data);
         } catch (err: unknown) {
           return JSON.stringify({ error: (err as Error).message });
@@ -11782,8 +11871,7 @@ async function executeTool(
       case 'polymarket_tag_relations': {
         const tagId = toolInput.tag_id as string;
         try {
-          const response = await fetch(`https://gamma-api.polymarket.com/tags/${encodeURIComponent(tagId)}/relations`);
-          const data = await response.json() as ApiResponse;
+          const data = await fetchPolymarketPublicCached(`https://gamma-api.polymarket.com/tags/${encodeURIComponent(tagId)}/relations`);
           return JSON.stringify(data);
         } catch (err: unknown) {
           return JSON.stringify({ error: (err as Error).message });
@@ -11796,8 +11884,7 @@ async function executeTool(
 
       case 'polymarket_sports': {
         try {
-          const response = await fetch('https://gamma-api.polymarket.com/sports');
-          const data = await response.json() as ApiResponse;
+          const data = await fetchPolymarketPublicCached('https://gamma-api.polymarket.com/sports');
           return JSON.stringify(data);
         } catch (err: unknown) {
           return JSON.stringify({ error: (err as Error).message });
@@ -11810,8 +11897,7 @@ async function executeTool(
           const url = sport
             ? `https://gamma-api.polymarket.com/teams?sport=${encodeURIComponent(sport)}`
             : 'https://gamma-api.polymarket.com/teams';
-          const response = await fetch(url);
-          const data = await response.json() as ApiResponse;
+          const data = await fetchPolymarketPublicCached(url);
           return JSON.stringify(data);
         } catch (err: unknown) {
           return JSON.stringify({ error: (err as Error).message });
@@ -11853,6 +11939,7 @@ async function executeTool(
         const polyCreds = context.tradingContext?.credentials.get('polymarket');
         const walletAddr = address || (polyCreds?.data as PolymarketCredentials)?.funderAddress;
         if (!walletAddr) return JSON.stringify({ error: 'No address provided and no credentials set up.' });
+        if (!EVM_ADDRESS_RE.test(walletAddr)) return JSON.stringify({ error: `Invalid wallet address: ${walletAddr}` });
         try {
           const response = await fetch(`https://data-api.polymarket.com/value?address=${walletAddr}`);
           const data = await response.json() as ApiResponse;
@@ -11867,6 +11954,7 @@ async function executeTool(
         const polyCreds = context.tradingContext?.credentials.get('polymarket');
         const walletAddr = address || (polyCreds?.data as PolymarketCredentials)?.funderAddress;
         if (!walletAddr) return JSON.stringify({ error: 'No address provided and no credentials set up.' });
+        if (!EVM_ADDRESS_RE.test(walletAddr)) return JSON.stringify({ error: `Invalid wallet address: ${walletAddr}` });
         try {
           const response = await fetch(`https://data-api.polymarket.com/positions?address=${walletAddr}&closed=true&_limit=50`);
           const data = await response.json() as ApiResponse;
@@ -11881,6 +11969,7 @@ async function executeTool(
         const polyCreds = context.tradingContext?.credentials.get('polymarket');
         const walletAddr = address || (polyCreds?.data as PolymarketCredentials)?.funderAddress;
         if (!walletAddr) return JSON.stringify({ error: 'No address provided and no credentials set up.' });
+        if (!EVM_ADDRESS_RE.test(walletAddr)) return JSON.stringify({ error: `Invalid wallet address: ${walletAddr}` });
         try {
           // PnL timeseries not available — compute from closed positions
           const response = await fetch(`https://data-api.polymarket.com/positions?user=${walletAddr.toLowerCase()}&closed=true&limit=500&sortBy=TIMESTAMP&sortDirection=DESC`);
@@ -11901,6 +11990,7 @@ async function executeTool(
         const polyCreds = context.tradingContext?.credentials.get('polymarket');
         const walletAddr = address || (polyCreds?.data as PolymarketCredentials)?.funderAddress;
         if (!walletAddr) return JSON.stringify({ error: 'No address provided and no credentials set up.' });
+        if (!EVM_ADDRESS_RE.test(walletAddr)) return JSON.stringify({ error: `Invalid wallet address: ${walletAddr}` });
         try {
           // Compute PnL from open + closed positions
           const [openRes, closedRes, valueRes] = await Promise.all([
@@ -11931,9 +12021,12 @@ async function executeTool(
         const polyCreds = context.tradingContext?.credentials.get('polymarket');
         const walletAddr = address || (polyCreds?.data as PolymarketCredentials)?.funderAddress;
         if (!walletAddr) return JSON.stringify({ error: 'No address provided and no credentials set up.' });
+        if (!EVM_ADDRESS_RE.test(walletAddr)) return JSON.stringify({ error: `Invalid wallet address: ${walletAddr}` });
         try {
-          const response = await fetch(`https://data-api.polymarket.com/v1/leaderboard?user=${walletAddr.toLowerCase()}&timePeriod=ALL&limit=1`);
-          const data = await response.json() as ApiResponse;
+          const data = await fetchPolymarketPublicCached(
+            `https://data-api.polymarket.com/v1/leaderboard?user=${walletAddr.toLowerCase()}&timePeriod=ALL&limit=1`,
+            POLYMARKET_RANK_TTL_MS
+          );
           return JSON.stringify(data);
         } catch (err: unknown) {
           return JSON.stringify({ error: (err as Error).message });
@@ -11945,8 +12038,10 @@ async function executeTool(
         const period = (toolInput.period as string) || 'WEEK';
         const category = (toolInput.category as string) || 'OVERALL';
         try {
-          const response = await fetch(`https://data-api.polymarket.com/v1/leaderboard?limit=${Math.min(limit, 50)}&timePeriod=${period}&category=${category}&orderBy=PNL`);
-          const data = await response.json() as ApiResponse;
+          const data = await fetchPolymarketPublicCached(
+            `https://data-api.polymarket.com/v1/leaderboard?limit=${Math.min(limit, 50)}&timePeriod=${period}&category=${category}&orderBy=PNL`,
+            POLYMARKET_LEADERBOARD_TTL_MS
+          );
           return JSON.stringify(data);
         } catch (err: unknown) {
           return JSON.stringify({ error: (err as Error).message });
@@ -11956,8 +12051,10 @@ async function executeTool(
       case 'polymarket_top_holders': {
         const marketId = toolInput.market_id as string;
         try {
-          const response = await fetch(`https://data-api.polymarket.com/holders?market=${encodeURIComponent(marketId)}`);
-          const data = await response.json() as ApiResponse;
+          const data = await fetchPolymarketPublicCached(
+            `https://data-api.polymarket.com/holders?market=${encodeURIComponent(marketId)}`,
+            POLYMARKET_RANK_TTL_MS
+          );
           return JSON.stringify(data);
         } catch (err: unknown) {
           return JSON.stringify({ error: (err as Error).message });
@@ -11969,6 +12066,7 @@ async function executeTool(
         const polyCreds = context.tradingContext?.credentials.get('polymarket');
         const walletAddr = address || (polyCreds?.data as PolymarketCredentials)?.funderAddress;
         if (!walletAddr) return JSON.stringify({ error: 'No address provided and no credentials set up.' });
+        if (!EVM_ADDRESS_RE.test(walletAddr)) return JSON.stringify({ error: `Invalid wallet address: ${walletAddr}` });
         try {
           const response = await fetch(`https://data-api.polymarket.com/activity?user=${walletAddr.toLowerCase()}&limit=100`);
           const data = await response.json() as ApiResponse;
@@ -11981,8 +12079,11 @@ async function executeTool(
       case 'polymarket_open_interest': {
         const marketId = toolInput.market_id as string;
         try {
-          const response = await fetch(`https://data-api.polymarket.com/oi?market=${encodeURIComponent(marketId)}`);
-          const data = await response.json() as ApiResponse;
+          const data = await fetchPolymarketPublicCached(
+            `https://data-api.polymarket.com/oi?market=${encodeURIComponent(marketId)}`,
+            POLYMARKET_LIVE_STATS_TTL_MS,
+            { serveStale: false }
+          );
           return JSON.stringify(data);
         } catch (err: unknown) {
           return JSON.stringify({ error: (err as Error).message });
@@ -11993,8 +12094,11 @@ async function executeTool(
         const eventId = toolInput.event_id as string | undefined;
         if (!eventId) return JSON.stringify({ error: 'event_id is required for live volume' });
         try {
-          const response = await fetch(`https://data-api.polymarket.com/live-volume?id=${encodeURIComponent(eventId)}`);
-          const data = await response.json() as ApiResponse;
+          const data = await fetchPolymarketPublicCached(
+            `https://data-api.polymarket.com/live-volume?id=${encodeURIComponent(eventId)}`,
+            POLYMARKET_LIVE_STATS_TTL_MS,
+            { serveStale: false }
+          );
           return JSON.stringify(data);
         } catch (err: unknown) {
           return JSON.stringify({ error: (err as Error).message });
@@ -12032,8 +12136,10 @@ async function executeTool(
       case 'polymarket_profile': {
         const address = toolInput.address as string;
         try {
-          const response = await fetch(`https://gamma-api.polymarket.com/public-profile?address=${encodeURIComponent(address)}`);
-          const data = await response.json() as ApiResponse;
+          const data = await fetchPolymarketPublicCached(
+            `https://gamma-api.polymarket.com/public-profile?address=${encodeURIComponent(address)}`,
+            POLYMARKET_PROFILE_TTL_MS
+          );
           return JSON.stringify(data);
         } catch (err: unknown) {
           return JSON.stringify({ error: (err as Error).message });
@@ -28,7 +28,7 @@ import type {
   KalshiCredentials,
 } from '../types';
 import type { CredentialsManager } from '../types';
-import { buildKalshiHeadersForUrl } from '../utils/kalshi-auth';
+import { buildKalshiHeadersForUrl, notifyKalshiPortfolioWrite } from '../utils/kalshi-auth';
 import { logger } from '../utils/logger';
 
 // =============================================================================
@@ -1140,6 +1140,7 @@ function resolveAlertRecipient(userId: string): { platform: string; chatId: stri
         const headers = { ...buildKalshiHeadersForUrl(auth, 'POST', url), 'Content-Type': 'application/json' };
         const body = JSON.stringify({ ticker, action: 'sell', side, count, type: 'market' });
         const response = await fetch(url, { method: 'POST', headers, body });
+        notifyKalshiPortfolioWrite(auth.apiKeyId);
         const data = await response.json();
         await deps.credentials.markSuccess(user.id, 'kalshi');
         return { status: 'executed', output: JSON.stringify(data) };
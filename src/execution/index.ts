@@ -13,6 +13,9 @@
 
 import { createHmac, randomBytes } from 'crypto';
 import { logger } from '../utils/logger';
+import { parseRetryAfter } from '../utils/http';
+import { calculateDelay, sleep } from '../infra/retry';
+import { mapWithConcurrency } from '../utils/concurrency';
 import {
   buildPolymarketHeadersForUrl,
   PolymarketApiKeyAuth,
@@ -26,6 +29,7 @@ import {
 import {
   buildKalshiHeadersForUrl,
   KalshiApiKeyAuth,
+  notifyKalshiPortfolioWrite,
 } from '../utils/kalshi-auth';
 import {
   buildOpinionHeaders,
@@ -276,6 +280,31 @@ export interface ExecutionService {
   stop(): void;
 }
 
+// =============================================================================
+// HTTP HELPERS
+// =============================================================================
+
+/** Max bytes of an error response body kept for logs/messages */
+const ERROR_SNIPPET_BYTES = 256;
+
+/**
+ * Read only the head of an error response body and release the rest.
+ * 5xx HTML pages and rate-limit dumps can be large; during error storms
+ * buffering and decoding them whole dominates the failure path.
+ */
+async function readErrorSnippet(response: Response, maxBytes = ERROR_SNIPPET_BYTES): Promise<string> {
+  if (!response.body) return '';
+  const reader = response.body.getReader();
+  try {
+    const { value } = await reader.read();
+    return value ? new TextDecoder().decode(value.subarray(0, maxBytes)) : '';
+  } catch {
+    return '';
+  } finally {
+    reader.cancel().catch(() => {});
+  }
+}
+
 // =============================================================================
 // POLYMARKET EXECUTION
 // =============================================================================
@@ -409,6 +438,38 @@ function getNextNonce(): string {
   return (nonceBase + nonceCounter).toString();
 }
 
+interface PolymarketBookResponse {
+  bids?: Array<{ price: string; size: string }>;
+  asks?: Array<{ price: string; size: string }>;
+  tick_size?: string;
+}
+
+/**
+ * Parse a /book response and cache both the ladder and its tick size, so a
+ * tick-size lookup and a post-only check on the same token share one fetch.
+ */
+function cachePolymarketBook(tokenId: string, data: PolymarketBookResponse): OrderbookData {
+  const bids: [number, number][] = (data.bids || [])
+    .map((b) => [parseFloat(b.price), parseFloat(b.size)] as [number, number])
+    .sort((a, b) => b[0] - a[0]); // Highest bid first
+
+  const asks: [number, number][] = (data.asks || [])
+    .map((a) => [parseFloat(a.price), parseFloat(a.size)] as [number, number])
+    .sort((a, b) => a[0] - b[0]); // Lowest ask first
+
+  const bestBid = bids[0]?.[0] ?? 0;
+  const bestAsk = asks[0]?.[0] ?? 0.99;
+  const midPrice = (bestBid + bestAsk) / 2;
+
+  const orderbook: OrderbookData = { bids, asks, midPrice };
+  const now = Date.now();
+  orderbookCache.set(tokenId, { data: orderbook, cachedAt: now });
+  if (data.tick_size) {
+    tickSizeCache.set(tokenId, { tickSize: data.tick_size, cachedAt: now });
+  }
+  return orderbook;
+}
+
 /**
  * Get tick size for a token (from orderbook endpoint)
  * Valid tick sizes: "0.1", "0.01", "0.001", "0.0001"
@@ -432,10 +493,9 @@ export async function getPolymarketTickSize(tokenId: string): Promise<string> {
       if (!response.ok) {
         return '0.01'; // Default tick size
       }
-      const data = await response.json() as { tick_size?: string };
-      const tickSize = data.tick_size || '0.01';
-      tickSizeCache.set(tokenId, { tickSize, cachedAt: Date.now() });
-      return tickSize;
+      const data = await response.json() as PolymarketBookResponse;
+      cachePolymarketBook(tokenId, data);
+      return data.tick_size || '0.01';
     } catch {
       return '0.01';
     } finally {
@@ -520,26 +580,8 @@ export async function getPolymarketOrderbookCached(tokenId: string): Promise<Ord
     const response = await fetch(`${POLY_CLOB_URL}/book?token_id=${tokenId}`);
     if (!response.ok) return null;
 
-    const data = await response.json() as {
-      bids?: Array<{ price: string; size: string }>;
-      asks?: Array<{ price: string; size: string }>;
-    };
-
-    const bids: [number, number][] = (data.bids || [])
-      .map((b) => [parseFloat(b.price), parseFloat(b.size)] as [number, number])
-      .sort((a, b) => b[0] - a[0]); // Highest bid first
-
-    const asks: [number, number][] = (data.asks || [])
-      .map((a) => [parseFloat(a.price), parseFloat(a.size)] as [number, number])
-      .sort((a, b) => a[0] - b[0]); // Lowest ask first
-
-    const bestBid = bids[0]?.[0] ?? 0;
-    const bestAsk = asks[0]?.[0] ?? 0.99;
-    const midPrice = (bestBid + bestAsk) / 2;
-
-    const orderbook: OrderbookData = { bids, asks, midPrice };
-    orderbookCache.set(tokenId, { data: orderbook, cachedAt: Date.now() });
-    return orderbook;
+    const data = await response.json() as PolymarketBookResponse;
+    return cachePolymarketBook(tokenId, data);
   } catch {
     return null;
   }
@@ -644,7 +686,8 @@ export async function getPolymarketBalance(
     const USDC_POLYGON = '0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174';
     const paddedAddr = walletAddress.slice(2).toLowerCase().padStart(64, '0');
     const data = `0x70a08231${paddedAddr}`;
-    const rpcResponse = await fetch('https://polygon-rpc.com/', {
+    const rpcUrl = process.env.POLYGON_RPC_URL || 'https://polygon-rpc.com';
+    const rpcResponse = await fetch(rpcUrl, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify({ jsonrpc: '2.0', method: 'eth_call', params: [{ to: USDC_POLYGON, data }, 'latest'], id: 1 }),
@@ -1124,17 +1167,18 @@ async function placePolymarketOrder(
   };
   if (postOnly === true) order.postOnly = true;
 
-  const headers = buildPolymarketHeadersForUrl(auth, 'POST', url, order);
+  const orderBody = JSON.stringify(order);
+  const headers = buildPolymarketHeadersForUrl(auth, 'POST', url, orderBody);
 
   try {
     const response = await fetch(url, {
       method: 'POST',
       headers: { ...headers, 'Content-Type': 'application/json' },
-      body: JSON.stringify(order),
+      body: orderBody,
     });
 
     if (!response.ok) {
-      const errorBody = await response.text().catch(() => '');
+      const errorBody = await readErrorSnippet(response);
       const redactedError = errorBody.slice(0, 200).replace(/0x[a-fA-F0-9]{20,}/g, '0x***').replace(/"(api[Kk]ey|secret|password|token)"\s*:\s*"[^"]+"/g, '"$1":"***"');
       logger.error({ status: response.status, errorBody: redactedError, tokenId, side, price, size }, 'Polymarket order failed');
       return { success: false, error: `HTTP ${response.status}: ${redactedError}` };
@@ -1193,14 +1237,17 @@ async function placeSignedPolymarketOrder(
   postOrder.orderType = orderType as 'GTC' | 'GTD' | 'FOK';
   if (postOnly) postOrder.postOnly = true;
 
+  // Serialize once: the HMAC covers these exact bytes and retries reuse them
+  const orderBody = JSON.stringify(postOrder);
+
   try {
     const { response, data } = await polymarketRetryWithBackoff(async () => {
       // Build headers fresh for each attempt (timestamp-based HMAC)
-      const headers = buildPolymarketHeadersForUrl(auth, 'POST', url, postOrder);
+      const headers = buildPolymarketHeadersForUrl(auth, 'POST', url, orderBody);
       const resp = await fetch(url, {
         method: 'POST',
         headers: { ...headers, 'Content-Type': 'application/json' },
-        body: JSON.stringify(postOrder),
+        body: orderBody,
       });
       const json = (await resp.json()) as PolymarketOrderResponse;
       return { response: resp, data: json };
@@ -1347,17 +1394,18 @@ async function placePolymarketOrdersBatch(
   for (let i = 0; i < postOrders.length; i += 15) {
     const chunk = postOrders.slice(i, i + 15);
     const url = `${POLY_CLOB_URL}/orders`;
-    const headers = buildPolymarketHeadersForUrl(auth, 'POST', url, chunk);
+    const chunkBody = JSON.stringify(chunk);
+    const headers = buildPolymarketHeadersForUrl(auth, 'POST', url, chunkBody);
 
     try {
       const response = await fetch(url, {
         method: 'POST',
         headers: { ...headers, 'Content-Type': 'application/json' },
-        body: JSON.stringify(chunk),
+        body: chunkBody,
       });
 
       if (!response.ok) {
-        const error = await response.text();
+        const error = await readErrorSnippet(response);
         logger.error({ status: response.status, error, count: chunk.length }, 'Polymarket batch order failed');
         results.push(...chunk.map(() => ({ success: false, error: `HTTP ${response.status}` })));
         continue;
@@ -1406,13 +1454,14 @@ async function cancelPolymarketOrdersBatch(
 
   // DELETE /orders with array of IDs uses L2 HMAC auth (no order signing needed)
   const url = `${POLY_CLOB_URL}/orders`;
-  const headers = buildPolymarketHeadersForUrl(auth, 'DELETE', url, orderIds);
+  const idsBody = JSON.stringify(orderIds);
+  const headers = buildPolymarketHeadersForUrl(auth, 'DELETE', url, idsBody);
 
   try {
     const response = await fetch(url, {
       method: 'DELETE',
       headers: { ...headers, 'Content-Type': 'application/json' },
-      body: JSON.stringify(orderIds),
+      body: idsBody,
     });
 
     if (!response.ok) {
@@ -1492,46 +1541,69 @@ async function getPolymarketOpenOrders(auth: PolymarketApiKeyAuth): Promise<Open
 
 const KALSHI_API_URL = 'https://api.elections.kalshi.com/trade-api/v2';
 
+interface KalshiRetryOptions {
+  /**
+   * Whether the request is safe to replay. Non-idempotent requests (order
+   * placement) are retried only on 429, which Kalshi returns before processing
+   * the request; a 5xx, 408 or dropped connection may arrive after the order
+   * was already accepted.
+   */
+  idempotent: boolean;
+  maxAttempts?: number;
+  baseDelayMs?: number;
+}
+
 /**
  * Retry helper with exponential backoff for Kalshi API calls
- * Retries on: network errors, 5xx server errors, 429 rate limit
+ * Retries on: 429 rate limit; for idempotent requests also network errors, 408 and 5xx
  * Does NOT retry on: 4xx client errors (bad request, unauthorized, etc.)
  */
 async function kalshiRetryWithBackoff<T>(
   operation: () => Promise<{ response: Response; data: T }>,
-  maxAttempts: number = 3,
-  baseDelayMs: number = 1000
+  options: KalshiRetryOptions
 ): Promise<{ response: Response; data: T }> {
+  const { idempotent, maxAttempts = 3, baseDelayMs = 1000 } = options;
   let lastError: Error | null = null;
+  const backoff = { minDelay: baseDelayMs, maxDelay: 10_000, jitter: 0.25, backoffMultiplier: 2 };
 
   for (let attempt = 1; attempt <= maxAttempts; attempt++) {
     try {
       const result = await operation();
-
-      // Retry on 5xx or 429
-      if (result.response.status >= 500 || result.response.status === 429) {
-        if (attempt < maxAttempts) {
-          const delay = baseDelayMs * Math.pow(2, attempt - 1);
-          logger.warn(
-            { status: result.response.status, attempt, delay },
-            'Kalshi API error, retrying...'
-          );
-          await new Promise(resolve => setTimeout(resolve, delay));
-          continue;
+      const status = result.response.status;
+      const retryable = status === 429 || (idempotent && (status >= 500 || status === 408));
+
+      // Honor Retry-After when the server sends one
+      if (retryable && attempt < maxAttempts) {
+        const retryAfter = parseRetryAfter(result.response.headers.get('retry-after'));
+        const delay = retryAfter !== null
+          ? Math.min(retryAfter, backoff.maxDelay)
+          : calculateDelay(attempt, backoff);
+        logger.warn(
+          { status, attempt, delay },
+          'Kalshi API error, retrying...'
+        );
+        // Release the discarded response's connection
+        if (!result.response.bodyUsed) {
+          await result.response.body?.cancel().catch(() => {});
         }
+        await sleep(delay);
+        continue;
       }
 
       return result;
     } catch (error) {
       lastError = error instanceof Error ? error : new Error(String(error));
 
+      // The request may have reached Kalshi; only replay it if that is harmless
+      if (!idempotent) throw lastError;
+
       if (attempt < maxAttempts) {
-        const delay = baseDelayMs * Math.pow(2, attempt - 1);
+        const delay = calculateDelay(attempt, backoff);
         logger.warn(
           { error: lastError.message, attempt, delay },
           'Kalshi API network error, retrying...'
         );
-        await new Promise(resolve => setTimeout(resolve, delay));
+        await sleep(delay);
       }
     }
   }
@@ -1550,6 +1622,12 @@ interface KalshiOrderResponse {
   error?: { message: string };
 }
 
+/** DELETE /portfolio/orders/batched reply; `error` holds the body snippet of a failed request */
+interface KalshiBatchCancelResponse {
+  orders?: Array<{ order_id?: string; error?: unknown }>;
+  error?: unknown;
+}
+
 interface KalshiOpenOrder {
   order_id: string;
   ticker: string;
@@ -1565,6 +1643,18 @@ interface KalshiOpenOrder {
   status: string;
 }
 
+/**
+ * Open a pooled keep-alive connection to Kalshi ahead of the first order so the
+ * order-flow hot path doesn't pay DNS + TCP + TLS setup. Best-effort.
+ */
+function warmKalshiConnection(): void {
+  fetch(`${KALSHI_API_URL}/exchange/status`)
+    .then((resp) => resp.body?.cancel())
+    .catch((error) => {
+      logger.debug({ error }, 'Kalshi connection warmup failed');
+    });
+}
+
 async function placeKalshiOrder(
   auth: KalshiApiKeyAuth,
   ticker: string,
@@ -1637,6 +1727,8 @@ async function placeKalshiOrder(
     no_price: side === 'no' ? Math.round((effectivePrice + Number.EPSILON) * 100) : undefined,
     count,
   };
+  // Serialize once; retries only need fresh (timestamped) headers
+  const orderBody = JSON.stringify(order);
 
   try {
     const { response, data } = await kalshiRetryWithBackoff(async () => {
@@ -1648,11 +1740,13 @@ async function placeKalshiOrder(
           ...headers,
           'Content-Type': 'application/json',
         },
-        body: JSON.stringify(order),
+        body: orderBody,
       });
-      const json = (await resp.json()) as KalshiOrderResponse;
+      // Gateway/rate-limit pages are not JSON; a parse failure must not look like a network error
+      const json = (await resp.json().catch(() => ({}))) as KalshiOrderResponse;
       return { response: resp, data: json };
-    });
+    }, { idempotent: false });
+    notifyKalshiPortfolioWrite(auth.apiKeyId);
 
     if (!response.ok || data.error) {
       logger.error({ status: response.status, error: data.error }, 'Kalshi order failed');
@@ -1695,7 +1789,8 @@ async function cancelKalshiOrder(auth: KalshiApiKeyAuth, orderId: string): Promi
         },
       });
       return { response: resp, data: null };
-    });
+    }, { idempotent: true });
+    notifyKalshiPortfolioWrite(auth.apiKeyId);
 
     if (!response.ok) {
       logger.error({ status: response.status, orderId }, 'Failed to cancel Kalshi order');
@@ -1710,8 +1805,10 @@ async function cancelKalshiOrder(auth: KalshiApiKeyAuth, orderId: string): Promi
   }
 }
 
-async function getKalshiOpenOrders(auth: KalshiApiKeyAuth): Promise<OpenOrder[]> {
-  const url = `${KALSHI_API_URL}/portfolio/orders?status=resting`;
+async function getKalshiOpenOrders(auth: KalshiApiKeyAuth, ticker?: string): Promise<OpenOrder[]> {
+  const params = new URLSearchParams({ status: 'resting', limit: '1000' });
+  if (ticker) params.set('ticker', ticker);
+  const url = `${KALSHI_API_URL}/portfolio/orders?${params.toString()}`;
 
   try {
     const { response, data } = await kalshiRetryWithBackoff(async () => {
@@ -1725,7 +1822,7 @@ async function getKalshiOpenOrders(auth: KalshiApiKeyAuth): Promise<OpenOrder[]>
       });
       const json = (await resp.json()) as { orders: KalshiOpenOrder[] };
       return { response: resp, data: json };
-    });
+    }, { idempotent: true });
 
     if (!response.ok) {
       logger.error({ status: response.status }, 'Failed to fetch Kalshi orders');
@@ -1757,6 +1854,9 @@ async function getKalshiOpenOrders(auth: KalshiApiKeyAuth): Promise<OpenOrder[]>
   }
 }
 
+/** Max concurrent batched order requests, kept low for Kalshi's write rate limit */
+const KALSHI_BATCH_CONCURRENCY = 3;
+
 /**
  * Place multiple Kalshi orders in a single batch request.
  * Kalshi supports up to 20 orders per batch via POST /portfolio/orders/batched.
@@ -1774,13 +1874,15 @@ async function placeKalshiOrdersBatch(
 ): Promise<OrderResult[]> {
   if (orders.length === 0) return [];
 
-  const results: OrderResult[] = [];
-
   // Chunk into batches of 20 (Kalshi limit)
+  const chunks: Array<typeof orders> = [];
   for (let i = 0; i < orders.length; i += 20) {
-    const chunk = orders.slice(i, i + 20);
+    chunks.push(orders.slice(i, i + 20));
+  }
+
+  // Submit a few chunks at a time; results keep input order
+  const chunkResults = await mapWithConcurrency(chunks, KALSHI_BATCH_CONCURRENCY, async (chunk): Promise<OrderResult[]> => {
     const url = `${KALSHI_API_URL}/portfolio/orders/batched`;
-    const headers = buildKalshiHeadersForUrl(auth, 'POST', url);
 
     const body = {
       orders: chunk.map(o => ({
@@ -1794,22 +1896,32 @@ async function placeKalshiOrdersBatch(
       })),
     };
 
+    const batchBody = JSON.stringify(body);
+
     try {
-      const response = await fetch(url, {
-        method: 'POST',
-        headers: { ...headers, 'Content-Type': 'application/json' },
-        body: JSON.stringify(body),
-      });
+      // The orders carry no client_order_id, so a replay after Kalshi accepted the
+      // batch would place them twice; only 429s are retried
+      const { response } = await kalshiRetryWithBackoff(async () => {
+        // Fresh (timestamped) headers per attempt
+        const headers = buildKalshiHeadersForUrl(auth, 'POST', url);
+        const resp = await fetch(url, {
+          method: 'POST',
+          headers: { ...headers, 'Content-Type': 'application/json' },
+          body: batchBody,
+        });
+        return { response: resp, data: null };
+      }, { idempotent: false });
+      notifyKalshiPortfolioWrite(auth.apiKeyId);
 
       if (!response.ok) {
-        const error = await response.text();
+        const error = await readErrorSnippet(response);
         logger.error({ status: response.status, error, count: chunk.length }, 'Kalshi batch order failed');
-        results.push(...chunk.map(() => ({ success: false, error: `HTTP ${response.status}` })));
-        continue;
+        return chunk.map(() => ({ success: false, error: `HTTP ${response.status}` }));
       }
 
       const data = (await response.json()) as { orders?: Array<{ order_id: string; status: string; filled_count?: number }> };
       const respOrders = data.orders || [];
+      const results: OrderResult[] = [];
 
       for (let j = 0; j < chunk.length; j++) {
         const r = respOrders[j];
@@ -1826,16 +1938,17 @@ async function placeKalshiOrdersBatch(
       }
 
       logger.info({ count: chunk.length, successful: respOrders.filter(r => r?.order_id).length }, 'Kalshi batch orders placed');
+      return results;
     } catch (error) {
       logger.error({ error }, 'Error placing Kalshi batch orders');
-      results.push(...chunk.map(() => ({
+      return chunk.map(() => ({
         success: false,
         error: error instanceof Error ? error.message : 'Batch order failed',
-      })));
+      }));
     }
-  }
+  });
 
-  return results;
+  return chunkResults.flat();
 }
 
 /**
@@ -1848,39 +1961,57 @@ async function cancelKalshiOrdersBatch(
 ): Promise<Array<{ orderId: string; success: boolean }>> {
   if (orderIds.length === 0) return [];
 
-  const results: Array<{ orderId: string; success: boolean }> = [];
-
+  const chunks: string[][] = [];
   for (let i = 0; i < orderIds.length; i += 20) {
-    const chunk = orderIds.slice(i, i + 20);
-    const url = `${KALSHI_API_URL}/portfolio/orders/batched`;
-    const headers = buildKalshiHeadersForUrl(auth, 'DELETE', url);
+    chunks.push(orderIds.slice(i, i + 20));
+  }
 
-    const body = {
+  // Chunks are independent; send a few at a time to stay under the write rate limit
+  const chunkResults = await mapWithConcurrency(chunks, KALSHI_BATCH_CONCURRENCY, async (chunk) => {
+    const url = `${KALSHI_API_URL}/portfolio/orders/batched`;
+    const batchBody = JSON.stringify({
       orders: chunk.map(id => ({ order_id: id })),
-    };
+    });
 
     try {
-      const response = await fetch(url, {
-        method: 'DELETE',
-        headers: { ...headers, 'Content-Type': 'application/json' },
-        body: JSON.stringify(body),
-      });
+      const { response, data } = await kalshiRetryWithBackoff<KalshiBatchCancelResponse>(async () => {
+        const headers = buildKalshiHeadersForUrl(auth, 'DELETE', url);
+        const resp = await fetch(url, {
+          method: 'DELETE',
+          headers: { ...headers, 'Content-Type': 'application/json' },
+          body: batchBody,
+        });
+        if (!resp.ok) {
+          // Read the head of the body so the connection is released
+          return { response: resp, data: { error: await readErrorSnippet(resp) } };
+        }
+        const json = (await resp.json().catch(() => ({}))) as KalshiBatchCancelResponse;
+        return { response: resp, data: json };
+      }, { idempotent: true });
+      notifyKalshiPortfolioWrite(auth.apiKeyId);
 
       if (!response.ok) {
-        logger.error({ status: response.status, count: chunk.length }, 'Kalshi batch cancel failed');
-        results.push(...chunk.map(id => ({ orderId: id, success: false })));
-        continue;
+        logger.error({ status: response.status, error: data.error, orderIds: chunk }, 'Kalshi batch cancel failed');
+        return chunk.map(id => ({ orderId: id, success: false }));
       }
 
-      logger.info({ count: chunk.length }, 'Kalshi batch cancel completed');
-      results.push(...chunk.map(id => ({ orderId: id, success: true })));
+      // A 200 can still carry per-order errors; those orders are left resting
+      const failedIds = new Set(
+        (data.orders || []).filter(r => r.order_id && r.error).map(r => r.order_id as string)
+      );
+      if (failedIds.size > 0) {
+        logger.warn({ orderIds: Array.from(failedIds) }, 'Kalshi batch cancel left some orders resting');
+      }
+
+      logger.info({ count: chunk.length - failedIds.size }, 'Kalshi batch cancel completed');
+      return chunk.map(id => ({ orderId: id, success: !failedIds.has(id) }));
     } catch (error) {
-      logger.error({ error }, 'Error batch cancelling Kalshi orders');
-      results.push(...chunk.map(id => ({ orderId: id, success: false })));
+      logger.error({ error, orderIds: chunk }, 'Error batch cancelling Kalshi orders');
+      return chunk.map(id => ({ orderId: id, success: false }));
     }
-  }
+  });
 
-  return results;
+  return chunkResults.flat();
 }
 
 /**
@@ -1913,6 +2044,7 @@ async function amendKalshiOrder(
       headers: { ...headers, 'Content-Type': 'application/json' },
       body: JSON.stringify(body),
     });
+    notifyKalshiPortfolioWrite(auth.apiKeyId);
 
     const data = (await response.json()) as { order?: { order_id: string; status: string } };
 
@@ -2415,52 +2547,31 @@ async function getPolymarketUSDCAllowance(
   }
 }
 
+/** Max concurrent /book requests in getPolymarketOrderbooksBatch */
+const POLY_BOOK_FETCH_CONCURRENCY = 10;
+
 /**
  * Batch fetch orderbooks for multiple tokens
  */
 async function getPolymarketOrderbooksBatch(
   tokenIds: string[]
 ): Promise<Map<string, OrderbookData | null>> {
-  const results = new Map<string, OrderbookData | null>();
-
-  // Fetch in parallel with concurrency limit
-  const BATCH_SIZE = 10;
-  for (let i = 0; i < tokenIds.length; i += BATCH_SIZE) {
-    const batch = tokenIds.slice(i, i + BATCH_SIZE);
-    const promises = batch.map(async (tokenId) => {
-      try {
-        const response = await fetch(`${POLY_CLOB_URL}/book?token_id=${tokenId}`);
-        if (!response.ok) {
-          results.set(tokenId, null);
-          return;
-        }
-
-        const data = await response.json() as {
-          bids?: Array<{ price: string; size: string }>;
-          asks?: Array<{ price: string; size: string }>;
-        };
-
-        const bids: [number, number][] = (data.bids || [])
-          .map((b) => [parseFloat(b.price), parseFloat(b.size)] as [number, number])
-          .sort((a, b) => b[0] - a[0]);
-
-        const asks: [number, number][] = (data.asks || [])
-          .map((a) => [parseFloat(a.price), parseFloat(a.size)] as [number, number])
-          .sort((a, b) => a[0] - b[0]);
-
-        const bestBid = bids[0]?.[0] ?? 0;
-        const bestAsk = asks[0]?.[0] ?? 0.99;
-        const midPrice = (bestBid + bestAsk) / 2;
-
-        results.set(tokenId, { bids, asks, midPrice });
-      } catch {
-        results.set(tokenId, null);
+  // Sliding window: a slow book only holds up its own slot, not a whole wave
+  const books = await mapWithConcurrency(tokenIds, POLY_BOOK_FETCH_CONCURRENCY, async (tokenId) => {
+    try {
+      const response = await fetch(`${POLY_CLOB_URL}/book?token_id=${tokenId}`);
+      if (!response.ok) {
+        await response.body?.cancel().catch(() => {});
+        return null;
       }
-    });
-
-    await Promise.all(promises);
-  }
+      return cachePolymarketBook(tokenId, await response.json() as PolymarketBookResponse);
+    } catch {
+      return null;
+    }
+  });
 
+  const results = new Map<string, OrderbookData | null>();
+  tokenIds.forEach((tokenId, i) => results.set(tokenId, books[i]));
   return results;
 }
 
@@ -2471,6 +2582,10 @@ async function getPolymarketOrderbooksBatch(
 export function createExecutionService(config: ExecutionConfig): ExecutionService {
   const maxOrderSize = config.maxOrderSize || 1000; // Default $1000 max
 
+  if (config.kalshi && !config.dryRun) {
+    warmKalshiConnection();
+  }
+
   // ==========================================================================
   // REAL-TIME FILL TRACKING (Polymarket WebSocket)
   // ==========================================================================
@@ -2640,7 +2755,7 @@ export function createExecutionService(config: ExecutionConfig): ExecutionServic
     });
 
     if (!response.ok) {
-      const text = await response.text();
+      const text = await readErrorSnippet(response);
       throw new Error(`Heartbeat failed: ${response.status} ${text}`);
     }
 
@@ -3003,16 +3118,20 @@ export function createExecutionService(config: ExecutionConfig): ExecutionServic
         }
       }
 
-      // Kalshi: fetch open orders, batch cancel matching ones
+      // Kalshi: fetch resting orders (filtered server-side by market), batch cancel them
       if ((!platform || platform === 'kalshi') && config.kalshi) {
         try {
-          const orders = await getKalshiOpenOrders(config.kalshi);
+          const orders = await getKalshiOpenOrders(config.kalshi, marketId);
           const toCancel = orders
             .filter(o => !marketId || o.marketId === marketId)
             .map(o => o.orderId);
           if (toCancel.length > 0) {
             const results = await cancelKalshiOrdersBatch(config.kalshi, toCancel);
             count += results.filter(r => r.success).length;
+            const failed = results.filter(r => !r.success).map(r => r.orderId);
+            if (failed.length > 0) {
+              errors.push(`Kalshi: ${failed.length} order(s) still resting: ${failed.join(', ')}`);
+            }
           }
         } catch (err) {
           errors.push(`Kalshi: ${(err as Error).message}`);
@@ -3129,6 +3248,11 @@ export function createExecutionService(config: ExecutionConfig): ExecutionServic
 
       const maxSlippage = maxSlippageOverride ?? request.maxSlippage ?? slippageConfig.maxSlippage;
 
+      // Reject a bad size before fetching the book
+      if (!Number.isFinite(request.size) || request.size <= 0) {
+        return { success: false, error: `Invalid size: ${request.size}` };
+      }
+
       // Estimate slippage before executing
       const slippageEstimate = await this.estimateSlippage({ ...request, side: 'buy' });
 
@@ -3169,6 +3293,11 @@ export function createExecutionService(config: ExecutionConfig): ExecutionServic
 
       const maxSlippage = maxSlippageOverride ?? request.maxSlippage ?? slippageConfig.maxSlippage;
 
+      // Reject a bad size before fetching the book
+      if (!Number.isFinite(request.size) || request.size <= 0) {
+        return { success: false, error: `Invalid size: ${request.size}` };
+      }
+
       // Estimate slippage before executing
       const slippageEstimate = await this.estimateSlippage({ ...request, side: 'sell' });
 
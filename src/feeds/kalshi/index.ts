@@ -44,9 +44,18 @@ import { Market, Orderbook, PriceUpdate, Platform } from '../../types';
 import { logger } from '../../utils/logger';
 import { buildKalshiHeadersForUrl, KalshiApiKeyAuth, normalizeKalshiPrivateKey } from '../../utils/kalshi-auth';
 import { getGlobalFreshnessTracker, type FreshnessTracker } from '../freshness';
+import { createCache } from '../../cache';
+import { createMicroBatcher } from '../../utils/concurrency';
 
 const BASE_URL = 'https://api.elections.kalshi.com/trade-api/v2';
 const WS_URL = 'wss://api.elections.kalshi.com/trade-api/ws/v2';
+/**
+ * Queries shaped like a Kalshi ticker: a KX-prefixed series followed by '-'.
+ * Ordinary dashed searches ("COVID-19", "GPT-5") must not be narrowed by series.
+ */
+const KALSHI_TICKER_QUERY = /^KX[A-Z0-9]+-[A-Z0-9.-]*$/;
+/** Tickers per GET /markets?tickers= request */
+const MULTI_TICKER_CHUNK = 100;
 
 interface KalshiMarket {
   ticker: string;
@@ -172,6 +181,13 @@ export async function createKalshiFeed(config?: {
   const subscribedTickers = new Set<string>();
   const priceCache = new Map<string, number>();
 
+  // Short-lived REST caches so bursts of reads for the same ticker (trading
+  // loops, UI refreshes) don't each pay a round-trip. Misses/nulls aren't cached.
+  const marketCache = createCache<string, Market>({ name: 'kalshi-markets', maxSize: 2048, defaultTtl: 2_000 });
+  const orderbookCache = createCache<string, Orderbook>({ name: 'kalshi-orderbooks', maxSize: 2048, defaultTtl: 2_000 });
+  const eventCache = createCache<string, KalshiEventResult>({ name: 'kalshi-events', maxSize: 512, defaultTtl: 30_000 });
+  const eventListCache = createCache<string, KalshiEventResult[]>({ name: 'kalshi-event-lists', maxSize: 64, defaultTtl: 30_000 });
+
   // Freshness tracking for WebSocket health monitoring
   const freshnessTracker: FreshnessTracker = getGlobalFreshnessTracker();
 
@@ -775,33 +791,54 @@ export async function createKalshiFeed(config?: {
     };
   }
 
-  async function searchMarkets(query: string): Promise<Market[]> {
-    try {
-      const params = new URLSearchParams({
-        status: 'open',
-        limit: '20',
-      });
+  async function fetchOpenMarkets(seriesTicker?: string): Promise<KalshiMarket[]> {
+    const params = new URLSearchParams({
+      status: 'open',
+      limit: '20',
+    });
+    if (seriesTicker) params.set('series_ticker', seriesTicker);
 
-      const url = `${BASE_URL}/markets?${params}`;
-      const response = await fetch(url, {
-        headers: getHeaders('GET', url),
-      });
+    const url = `${BASE_URL}/markets?${params}`;
+    const response = await fetch(url, {
+      headers: getHeaders('GET', url),
+    });
 
-      if (!response.ok) {
-        throw new Error(`Kalshi API error: ${response.status}`);
-      }
+    if (!response.ok) {
+      throw new Error(`Kalshi API error: ${response.status}`);
+    }
 
-      const data: any = await response.json();
-      const markets: KalshiMarket[] = data.markets || [];
+    const data: any = await response.json();
+    return data.markets || [];
+  }
 
-      // Filter by query
-      const queryLower = query.toLowerCase();
-      const filtered = markets.filter(m =>
-        m.title.toLowerCase().includes(queryLower) ||
-        m.ticker.toLowerCase().includes(queryLower)
-      );
+  async function searchMarkets(query: string): Promise<Market[]> {
+    try {
+      const trimmed = query.trim();
+      const queryLower = trimmed.toLowerCase();
+
+      // Filter by query and convert in a single pass
+      const matchMarkets = (markets: KalshiMarket[]): Market[] => {
+        const results: Market[] = [];
+        for (const m of markets) {
+          // One lowercase + one scan per market over a NUL-joined record; NUL
+          // never appears in a query, so matches can't straddle fields.
+          const haystack = `${m.ticker}\0${m.title}`.toLowerCase();
+          if (haystack.includes(queryLower)) {
+            results.push(convertToMarket(m));
+          }
+        }
+        return results;
+      };
+
+      // Ticker-shaped queries (e.g. "KXBTC-25DEC31") are narrowed server-side
+      // by series so the page isn't spent on unrelated markets. If that finds
+      // nothing (unknown series, typo), search unfiltered instead.
+      if (KALSHI_TICKER_QUERY.test(trimmed)) {
+        const results = matchMarkets(await fetchOpenMarkets(trimmed.split('-')[0]));
+        if (results.length > 0) return results;
+      }
 
-      return filtered.map(convertToMarket);
+      return matchMarkets(await fetchOpenMarkets());
     } catch (error) {
       logger.error('Kalshi: Search error', error);
       return [];
@@ -809,6 +846,13 @@ export async function createKalshiFeed(config?: {
   }
 
   async function getMarket(ticker: string): Promise<Market | null> {
+    const cached = marketCache.get(ticker);
+    if (cached) return cached;
+    // Concurrent lookups within a few ms are coalesced into one multi-ticker request
+    return marketBatcher.submit(ticker);
+  }
+
+  async function fetchMarket(ticker: string): Promise<Market | null> {
     try {
       const url = `${BASE_URL}/markets/${ticker}`;
       const response = await fetch(url, {
@@ -821,7 +865,9 @@ export async function createKalshiFeed(config?: {
       }
 
       const data: any = await response.json();
-      return convertToMarket(data.market);
+      const market = convertToMarket(data.market);
+      marketCache.set(ticker, market);
+      return market;
     } catch (error) {
       logger.error(`Kalshi: Error fetching market ${ticker}`, error);
       return null;
@@ -849,6 +895,8 @@ export async function createKalshiFeed(config?: {
   }
 
   async function getOrderbook(ticker: string): Promise<Orderbook | null> {
+    const cached = orderbookCache.get(ticker);
+    if (cached) return cached;
     try {
       const url = `${BASE_URL}/markets/${ticker}/orderbook`;
       const response = await fetch(url, {
@@ -884,7 +932,7 @@ export async function createKalshiFeed(config?: {
           ? bestAsk - bestBid
           : 0;
 
-      return {
+      const result: Orderbook = {
         platform: 'kalshi',
         marketId: ticker,
         outcomeId: `${ticker}-yes`,
@@ -894,19 +942,71 @@ export async function createKalshiFeed(config?: {
         midPrice,
         timestamp: Date.now(),
       };
+      orderbookCache.set(ticker, result);
+      return result;
     } catch (error) {
       logger.error(`Kalshi: Error fetching orderbook ${ticker}`, error);
       return null;
     }
   }
 
+  /**
+   * Resolve a batch of distinct tickers with GET /markets?tickers=a,b,c.
+   * A single ticker (or any ticker missing from the multi response) uses the
+   * per-market endpoint, which keeps 404 -> null semantics; a failed multi
+   * call falls back to per-market requests.
+   */
+  async function fetchMarketsMulti(tickers: string[]): Promise<Array<Market | null>> {
+    if (tickers.length === 1) return [await fetchMarket(tickers[0])];
+
+    let found: Map<string, Market>;
+    try {
+      const params = new URLSearchParams({ tickers: tickers.join(','), limit: String(tickers.length) });
+      const url = `${BASE_URL}/markets?${params}`;
+      const response = await fetch(url, { headers: getHeaders('GET', url) });
+      if (!response.ok) throw new Error(`Kalshi API error: ${response.status}`);
+
+      const data = (await response.json()) as { markets?: KalshiMarket[] };
+      found = new Map();
+      for (const m of data.markets || []) {
+        const market = convertToMarket(m);
+        marketCache.set(m.ticker, market);
+        found.set(m.ticker, market);
+      }
+    } catch (error) {
+      logger.warn({ error, count: tickers.length }, 'Kalshi: Multi-ticker fetch failed, falling back to per-market');
+      found = new Map();
+    }
+
+    return Promise.all(tickers.map((ticker) => found.get(ticker) ?? fetchMarket(ticker)));
+  }
+
+  const marketBatcher = createMicroBatcher<string, Market | null>({
+    maxBatch: MULTI_TICKER_CHUNK,
+    maxWaitMs: 5,
+    execute: fetchMarketsMulti,
+  });
+
+  /** Fetch many markets; lookups are coalesced into multi-ticker requests */
+  async function getMarketsBatch(tickers: string[]): Promise<Map<string, Market>> {
+    const markets = await Promise.all(tickers.map(getMarket));
+    const results = new Map<string, Market>();
+    tickers.forEach((ticker, i) => {
+      const market = markets[i];
+      if (market) results.set(ticker, market);
+    });
+    return results;
+  }
+
   async function pollPrices(): Promise<void> {
     if (wsConnected) return;
     if (subscribedTickers.size === 0) return;
 
+    const markets = await getMarketsBatch(Array.from(subscribedTickers));
+
     for (const ticker of subscribedTickers) {
       try {
-        const market = await getMarket(ticker);
+        const market = markets.get(ticker);
         if (!market) continue;
 
         const currentPrice = market.outcomes[0].price;
@@ -951,6 +1051,10 @@ export async function createKalshiFeed(config?: {
         pollInterval = null;
       }
       disconnectWebsocket();
+      marketCache.clear();
+      orderbookCache.clear();
+      eventCache.clear();
+      eventListCache.clear();
       apiKeyAuth = null;
       logger.info('Kalshi: Disconnected');
       emitter.emit('disconnected');
@@ -1021,6 +1125,10 @@ export async function createKalshiFeed(config?: {
         });
         if (params?.category) qs.set('series_ticker', params.category);
 
+        const cacheKey = qs.toString();
+        const cached = eventListCache.get(cacheKey);
+        if (cached) return cached;
+
         const url = `${BASE_URL}/events?${qs}`;
         const response = await fetch(url, { headers: getHeaders('GET', url) });
         if (!response.ok) throw new Error(`Kalshi API error: ${response.status}`);
@@ -1028,12 +1136,16 @@ export async function createKalshiFeed(config?: {
         const data = (await response.json()) as { events?: KalshiEvent[] };
         const events = data.events || [];
 
-        return events.map(e => ({
+        const results = events.map(e => ({
           eventTicker: e.event_ticker,
           title: e.title,
           category: e.category,
           markets: (e.markets || []).map(convertToMarket),
         }));
+        eventListCache.set(cacheKey, results);
+        // Listed events carry nested markets, so they also answer getEvent()
+        for (const event of results) eventCache.set(event.eventTicker, event);
+        return results;
       } catch (error) {
         logger.error('Kalshi: Events fetch error', error);
         return [];
@@ -1041,6 +1153,8 @@ export async function createKalshiFeed(config?: {
     },
 
     async getEvent(eventTicker: string): Promise<KalshiEventResult | null> {
+      const cached = eventCache.get(eventTicker);
+      if (cached) return cached;
       try {
         const url = `${BASE_URL}/events/${eventTicker}?with_nested_markets=true`;
         const response = await fetch(url, { headers: getHeaders('GET', url) });
@@ -1053,12 +1167,14 @@ export async function createKalshiFeed(config?: {
         const e = data.event;
         if (!e) return null;
 
-        return {
+        const result: KalshiEventResult = {
           eventTicker: e.event_ticker,
           title: e.title,
           category: e.category,
           markets: (e.markets || []).map(convertToMarket),
         };
+        eventCache.set(eventTicker, result);
+        return result;
       } catch (error) {
         logger.error(`Kalshi: Error fetching event ${eventTicker}`, error);
         return null;
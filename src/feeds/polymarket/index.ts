@@ -15,6 +15,11 @@ const WS_URL = 'wss://ws-subscriptions-clob.polymarket.com/ws/market';
 const REST_URL = 'https://clob.polymarket.com';
 const GAMMA_URL = 'https://gamma-api.polymarket.com';
 
+export interface PolymarketFeedConfig {
+  /** Market-channel WebSocket URL (default: Polymarket production) */
+  wsUrl?: string;
+}
+
 export interface PolymarketFeed extends EventEmitter {
   start: () => Promise<void>;
   stop: () => Promise<void>;
@@ -52,7 +57,7 @@ interface PolymarketOrderbookResponse {
   asks: Array<{ price: string; size: string }>;
 }
 
-export async function createPolymarketFeed(): Promise<PolymarketFeed> {
+export async function createPolymarketFeed(config: PolymarketFeedConfig = {}): Promise<PolymarketFeed> {
   const emitter = new EventEmitter() as PolymarketFeed;
   let ws: WebSocket | null = null;
   let reconnectTimer: NodeJS.Timeout | null = null;
@@ -62,6 +67,11 @@ export async function createPolymarketFeed(): Promise<PolymarketFeed> {
   const subscriptions = new Map<string, Set<(update: PriceUpdate) => void>>();
   const lastPrices = new Map<string, number>();
 
+  // Latest full book pushed over the WebSocket per subscribed asset. Dropped as
+  // soon as any level/price change arrives, so a hit is exactly the live book.
+  const WS_BOOK_MAX_AGE_MS = 30_000;
+  const wsBooks = new Map<string, { book: Orderbook; receivedAt: number }>();
+
   // Market cache with TTL and size limit to prevent memory leaks
   const MARKET_CACHE_MAX_SIZE = 1000;
   const MARKET_CACHE_TTL_MS = 60 * 60 * 1000; // 1 hour
@@ -100,7 +110,7 @@ export async function createPolymarketFeed(): Promise<PolymarketFeed> {
     if (ws) return;
 
     logger.info('Connecting to Polymarket WebSocket');
-    const socket = new WebSocket(WS_URL);
+    const socket = new WebSocket(config.wsUrl || WS_URL);
     ws = socket;
 
     socket.on('open', () => {
@@ -131,6 +141,7 @@ export async function createPolymarketFeed(): Promise<PolymarketFeed> {
       if (ws !== socket) return; // Stale socket, ignore
       logger.warn('Polymarket WebSocket disconnected');
       ws = null;
+      wsBooks.clear();
       scheduleReconnect();
     });
 
@@ -299,8 +310,23 @@ export async function createPolymarketFeed(): Promise<PolymarketFeed> {
 
         const timestamp = toTimestamp(msg.timestamp);
 
-        // Emit orderbook update for tick recording
         if (bids.length > 0 || asks.length > 0) {
+          // Cache a copy taken before listeners see the parsed arrays, so their edits
+          // can't leak into getOrderbook
+          wsBooks.set(assetId, {
+            book: {
+              platform: 'polymarket',
+              marketId: assetId,
+              outcomeId: assetId,
+              bids: bids.map(([price, size]): [number, number] => [price, size]),
+              asks: asks.map(([price, size]): [number, number] => [price, size]),
+              spread: bestBid !== null && bestAsk !== null ? bestAsk - bestBid : 0,
+              midPrice: pickMidPrice(bestBid, bestAsk) ?? 0,
+              timestamp,
+            },
+            receivedAt: Date.now(),
+          });
+          // Emit orderbook update for tick recording
           emitOrderbookUpdate(assetId, marketId, bids, asks, timestamp);
         }
 
@@ -319,6 +345,7 @@ export async function createPolymarketFeed(): Promise<PolymarketFeed> {
           for (const change of priceChanges) {
             const assetId = change.asset_id as string | undefined;
             if (!assetId) continue;
+            wsBooks.delete(assetId);
             const bestBid = toNumber(change.best_bid);
             const bestAsk = toNumber(change.best_ask);
             const price = pickMidPrice(bestBid, bestAsk, toNumber(change.price));
@@ -332,6 +359,7 @@ export async function createPolymarketFeed(): Promise<PolymarketFeed> {
         const legacyAssetId = msg.asset_id as string | undefined;
         const legacyChanges = msg.changes as Array<Record<string, unknown>> | undefined;
         if (legacyAssetId && Array.isArray(legacyChanges)) {
+          wsBooks.delete(legacyAssetId);
           for (const change of legacyChanges) {
             const price = toNumber(change.price);
             if (price === null) continue;
@@ -344,6 +372,7 @@ export async function createPolymarketFeed(): Promise<PolymarketFeed> {
         const assetId = msg.asset_id as string | undefined;
         const marketId = (msg.market as string | undefined) || assetId;
         if (!assetId || !marketId) return;
+        wsBooks.delete(assetId);
         const bestBid = toNumber(msg.best_bid);
         const bestAsk = toNumber(msg.best_ask);
         const price = pickMidPrice(bestBid, bestAsk);
@@ -355,6 +384,7 @@ export async function createPolymarketFeed(): Promise<PolymarketFeed> {
         const assetId = msg.asset_id as string | undefined;
         const marketId = (msg.market as string | undefined) || assetId;
         if (!assetId || !marketId) return;
+        wsBooks.delete(assetId);
         const price = toNumber(msg.price);
         if (price === null) return;
         emitPriceUpdate(assetId, marketId, price, toTimestamp(msg.timestamp));
@@ -499,6 +529,7 @@ export async function createPolymarketFeed(): Promise<PolymarketFeed> {
       ws.close();
       ws = null;
     }
+    wsBooks.clear();
   };
 
   emitter.getMarket = async (_platform: string, marketId: string) => {
@@ -530,6 +561,16 @@ export async function createPolymarketFeed(): Promise<PolymarketFeed> {
     _platform: string,
     marketId: string
   ): Promise<Orderbook | null> => {
+    // Serve the streamed book while the socket is up and nothing has changed
+    const streamed = wsBooks.get(marketId);
+    if (
+      streamed &&
+      ws?.readyState === WebSocket.OPEN &&
+      subscriptions.has(marketId) &&
+      Date.now() - streamed.receivedAt < WS_BOOK_MAX_AGE_MS
+    ) {
+      return streamed.book;
+    }
     return fetchOrderbook(marketId);
   };
 
@@ -561,6 +602,7 @@ export async function createPolymarketFeed(): Promise<PolymarketFeed> {
         if (callbacks.size === 0) {
           subscriptions.delete(marketId);
           lastPrices.delete(marketId); // Clean up lastPrices to prevent memory leak
+          wsBooks.delete(marketId);
           freshnessTracker.untrack('polymarket', marketId);
           if (ws && ws.readyState === WebSocket.OPEN) {
             ws.send(
@@ -20,6 +20,7 @@ import {
   buildKalshiHeadersForUrl,
   KalshiApiKeyAuth,
 } from '../utils/kalshi-auth';
+import { mapWithConcurrency } from '../utils/concurrency';
 
 // =============================================================================
 // TYPES
@@ -375,20 +376,93 @@ async function fetchKalshiMarketPrice(
       headers: { ...headers, 'Content-Type': 'application/json' },
     });
 
-    if (!response.ok) return null;
+    if (!response.ok) {
+      await response.body?.cancel();
+      return null;
+    }
 
     const data = (await response.json()) as {
       market: { yes_price?: number; yes_bid?: number; no_bid?: number };
     };
-    const m = data.market;
-    const yesPrice = (m.yes_price ?? m.yes_bid ?? 0) / 100;
-    const noPrice = (m.no_bid ?? 0) / 100 || Math.max(0, 1 - yesPrice);
-    return { yesPrice, noPrice };
+    return toKalshiPrice(data.market);
   } catch {
     return null;
   }
 }
 
+/** Max tickers per multi-market request (Kalshi caps `limit` at 1000) */
+const KALSHI_TICKERS_PER_REQUEST = 100;
+/** Multi-market requests in flight at once */
+const KALSHI_PRICE_CHUNK_CONCURRENCY = 4;
+/** Per-market fallback requests in flight at once */
+const KALSHI_PRICE_FALLBACK_CONCURRENCY = 4;
+
+function toKalshiPrice(m: { yes_price?: number; yes_bid?: number; no_bid?: number }): { yesPrice: number; noPrice: number } {
+  const yesPrice = (m.yes_price ?? m.yes_bid ?? 0) / 100;
+  const noPrice = (m.no_bid ?? 0) / 100 || Math.max(0, 1 - yesPrice);
+  return { yesPrice, noPrice };
+}
+
+/**
+ * Fetch prices for many markets using GET /markets?tickers=a,b,c so a portfolio
+ * costs one round-trip per chunk instead of one per position. Any ticker missing
+ * from the multi responses (settled, delisted, or the chunk failed) falls back to
+ * a per-ticker request.
+ */
+async function fetchKalshiMarketPrices(
+  auth: KalshiApiKeyAuth,
+  tickers: string[]
+): Promise<Map<string, { yesPrice: number; noPrice: number }>> {
+  const priceMap = new Map<string, { yesPrice: number; noPrice: number }>();
+  const chunks: string[][] = [];
+  for (let i = 0; i < tickers.length; i += KALSHI_TICKERS_PER_REQUEST) {
+    chunks.push(tickers.slice(i, i + KALSHI_TICKERS_PER_REQUEST));
+  }
+
+  await mapWithConcurrency(chunks, KALSHI_PRICE_CHUNK_CONCURRENCY, async (chunk) => {
+    const params = new URLSearchParams({ tickers: chunk.join(','), limit: String(chunk.length) });
+    const url = `${KALSHI_API_URL}/markets?${params.toString()}`;
+    const headers = buildKalshiHeadersForUrl(auth, 'GET', url);
+
+    try {
+      const response = await fetch(url, {
+        method: 'GET',
+        headers: { ...headers, 'Content-Type': 'application/json' },
+      });
+      if (!response.ok) {
+        await response.body?.cancel();
+        throw new Error(`HTTP ${response.status}`);
+      }
+
+      const data = (await response.json()) as {
+        markets?: Array<{ ticker: string; yes_price?: number; yes_bid?: number; no_bid?: number }>;
+      };
+      for (const m of data.markets || []) {
+        priceMap.set(m.ticker, toKalshiPrice(m));
+      }
+    } catch (error) {
+      logger.warn({ error, count: chunk.length }, 'Kalshi multi-ticker price fetch failed; falling back to per-market');
+    }
+  });
+
+  // A failed chunk (typically 429/5xx) leaves up to a whole chunk missing; keep the
+  // per-market fallback on a short leash so it does not pile onto the rate limit
+  const missing = tickers.filter((ticker) => !priceMap.has(ticker));
+  const fallback = await mapWithConcurrency(missing, KALSHI_PRICE_FALLBACK_CONCURRENCY, (ticker) =>
+    fetchKalshiMarketPrice(auth, ticker)
+  );
+  missing.forEach((ticker, j) => {
+    const price = fallback[j];
+    if (price) {
+      priceMap.set(ticker, price);
+    } else {
+      logger.warn({ ticker }, 'Kalshi price unavailable; valuing position at average price');
+    }
+  });
+
+  return priceMap;
+}
+
 async function fetchKalshiPositions(auth: KalshiApiKeyAuth): Promise<Position[]> {
   const url = `${KALSHI_API_URL}/portfolio/positions`;
   const headers = buildKalshiHeadersForUrl(auth, 'GET', url);
@@ -410,16 +484,9 @@ async function fetchKalshiPositions(auth: KalshiApiKeyAuth): Promise<Position[]>
     const data = (await response.json()) as { market_positions: KalshiPosition[] };
     const positions = data.market_positions || [];
 
-    // Fetch current prices for all positions in parallel
-    const priceMap = new Map<string, { yesPrice: number; noPrice: number }>();
+    // Fetch current prices for all positions in one batched call
     const uniqueMarkets = Array.from(new Set(positions.map((p) => p.market_id)));
-
-    const prices = await Promise.all(
-      uniqueMarkets.map((ticker) => fetchKalshiMarketPrice(auth, ticker))
-    );
-    uniqueMarkets.forEach((ticker, i) => {
-      if (prices[i]) priceMap.set(ticker, prices[i]!);
-    });
+    const priceMap = await fetchKalshiMarketPrices(auth, uniqueMarkets);
 
     return positions.map((p) => {
       const shares = Math.abs(p.position);
@@ -745,6 +812,8 @@ export function createPortfolioService(config: PortfolioConfig, db?: Database):
   let cachedPositions: Position[] | null = null;
   let cachedBalances: PortfolioBalance[] | null = null;
   let lastFetch = 0;
+  /** In-flight refresh shared by concurrent callers (one snapshot, not N) */
+  let refreshInflight: Promise<void> | null = null;
 
   async function refreshIfStale(): Promise<void> {
     if (Date.now() - lastFetch > cacheTtl) {
@@ -810,10 +879,17 @@ export function createPortfolioService(config: PortfolioConfig, db?: Database):
       const positions = cachedPositions || [];
       const balances = cachedBalances || [];
 
-      const totalValue = positions.reduce((sum, p) => sum + p.value, 0);
-      const totalCostBasis = positions.reduce((sum, p) => sum + p.costBasis, 0);
-      const unrealizedPnL = positions.reduce((sum, p) => sum + p.unrealizedPnL, 0);
-      const realizedPnL = positions.reduce((sum, p) => sum + p.realizedPnL, 0);
+      // Single pass over positions for all aggregate P&L fields
+      let totalValue = 0;
+      let totalCostBasis = 0;
+      let unrealizedPnL = 0;
+      let realizedPnL = 0;
+      for (const p of positions) {
+        totalValue += p.value;
+        totalCostBasis += p.costBasis;
+        unrealizedPnL += p.unrealizedPnL;
+        realizedPnL += p.realizedPnL;
+      }
       const unrealizedPnLPct = totalCostBasis > 0 ? (unrealizedPnL / totalCostBasis) * 100 : 0;
 
       return {
@@ -917,8 +993,17 @@ export function createPortfolioService(config: PortfolioConfig, db?: Database):
     },
 
     async refresh() {
-      await Promise.allSettled([this.fetchPositions(), this.fetchBalances()]);
-      logger.info('Portfolio refreshed');
+      if (refreshInflight) return refreshInflight;
+      // Positions and balances for every exchange are fetched concurrently,
+      // so a snapshot costs max(RTT) rather than the sum of all endpoints.
+      refreshInflight = Promise.allSettled([this.fetchPositions(), this.fetchBalances()])
+        .then(() => {
+          logger.info('Portfolio refreshed');
+        })
+        .finally(() => {
+          refreshInflight = null;
+        });
+      return refreshInflight;
     },
 
     // =========================================================================
@@ -80,17 +80,30 @@ async function getCircuitBreaker() {
   return getGlobalCircuitBreaker();
 }
 
+let feedPending: Promise<KalshiFeed> | null = null;
+
+/**
+ * Shared feed for every command. Concurrent first calls wait on the same
+ * connect instead of each opening their own feed and WebSocket.
+ */
 async function getFeed(): Promise<KalshiFeed> {
-  if (!feedInstance) {
-    const { createKalshiFeed } = await import('../../../feeds/kalshi');
-    feedInstance = await createKalshiFeed({
-      apiKeyId: process.env.KALSHI_API_KEY_ID,
-      privateKeyPem: process.env.KALSHI_PRIVATE_KEY,
-      privateKeyPath: process.env.KALSHI_PRIVATE_KEY_PATH,
+  if (feedInstance) return feedInstance;
+  if (!feedPending) {
+    feedPending = (async () => {
+      const { createKalshiFeed } = await import('../../../feeds/kalshi');
+      const feed = await createKalshiFeed({
+        apiKeyId: process.env.KALSHI_API_KEY_ID,
+        privateKeyPem: process.env.KALSHI_PRIVATE_KEY,
+        privateKeyPath: process.env.KALSHI_PRIVATE_KEY_PATH,
+      });
+      await feed.connect();
+      feedInstance = feed;
+      return feed;
+    })().finally(() => {
+      feedPending = null;
     });
-    await feedInstance.connect();
   }
-  return feedInstance;
+  return feedPending;
 }
 
 function getExecution(): ExecutionService | null {
@@ -130,7 +143,7 @@ function startPricePolling(): void {
   pricePollingInterval = setInterval(async () => {
     if (priceSubscriptions.size === 0) return;
 
-    let feed;
+    let feed: KalshiFeed;
     try {
       feed = await getFeed();
     } catch (err) {
@@ -138,10 +151,12 @@ function startPricePolling(): void {
       return;
     }
 
-    for (const [ticker, callbacks] of priceSubscriptions) {
+    // Issue all lookups at once; the feed coalesces concurrent getMarket
+    // calls into multi-ticker requests instead of one round trip per ticker.
+    await Promise.all(Array.from(priceSubscriptions, async ([ticker, callbacks]) => {
       try {
         const market = await feed.getMarket(ticker);
-        if (!market) continue;
+        if (!market) return;
 
         const yesPrice = market.outcomes.find(o => o.name === 'Yes')?.price ?? 0;
 
@@ -163,7 +178,7 @@ function startPricePolling(): void {
       } catch (err) {
         logger.warn({ err, ticker }, 'Error polling Kalshi price');
       }
-    }
+    }));
   }, PRICE_POLL_INTERVAL_MS);
 
   logger.info('Kalshi price polling started');
@@ -925,8 +940,9 @@ async function handleBalance(): Promise<string> {
   }
 
   try {
-    const { buildKalshiHeadersForUrl, normalizeKalshiPrivateKey } = await import('../../../utils/kalshi-auth');
-    const auth = { apiKeyId, privateKeyPem: normalizeKalshiPrivateKey(privateKeyPem) };
+    // Signing normalizes and caches the parsed key, so pass the raw PEM through
+    const { buildKalshiHeadersForUrl } = await import('../../../utils/kalshi-auth');
+    const auth = { apiKeyId, privateKeyPem };
     const url = 'https://api.elections.kalshi.com/trade-api/v2/portfolio/balance';
     const headers = buildKalshiHeadersForUrl(auth, 'GET', url);
 
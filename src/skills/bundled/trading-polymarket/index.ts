@@ -313,6 +313,11 @@ async function handleBuy(tokenId: string, sizeStr: string, priceStr: string): Pr
     return 'Invalid size. Must be a positive number.';
   }
 
+  const price = parseFloat(priceStr);
+  if (priceStr && (isNaN(price) || price < 0.01 || price > 0.99)) {
+    return 'Invalid price. Must be between 0.01 and 0.99 (e.g., 0.65 for 65c).';
+  }
+
   // Circuit breaker pre-check
   const cb = await getCircuitBreaker();
   if (!cb.canTrade()) {
@@ -348,11 +353,6 @@ async function handleBuy(tokenId: string, sizeStr: string, priceStr: string): Pr
     }
   }
 
-  const price = parseFloat(priceStr);
-  if (isNaN(price) || price < 0.01 || price > 0.99) {
-    return 'Invalid price. Must be between 0.01 and 0.99 (e.g., 0.65 for 65c).';
-  }
-
   try {
     // Auto-detect neg_risk for crypto markets
     let negRisk: boolean | undefined;
@@ -426,6 +426,11 @@ async function handleSell(tokenId: string, sizeStr: string, priceStr: string): P
     return 'Invalid size. Must be a positive number.';
   }
 
+  const price = parseFloat(priceStr);
+  if (priceStr && (isNaN(price) || price < 0.01 || price > 0.99)) {
+    return 'Invalid price. Must be between 0.01 and 0.99.';
+  }
+
   // Circuit breaker pre-check
   const cb = await getCircuitBreaker();
   if (!cb.canTrade()) {
@@ -460,11 +465,6 @@ async function handleSell(tokenId: string, sizeStr: string, priceStr: string): P
     }
   }
 
-  const price = parseFloat(priceStr);
-  if (isNaN(price) || price < 0.01 || price > 0.99) {
-    return 'Invalid price. Must be between 0.01 and 0.99.';
-  }
-
   try {
     let negRisk: boolean | undefined;
     try {
@@ -627,7 +627,7 @@ async function handleBalance(): Promise<string> {
     const rpcTimeout = setTimeout(() => controller.abort(), 10_000);
     let result: { result?: string };
     try {
-      const response = await fetch('https://polygon-rpc.com/', {
+      const response = await fetch(process.env.POLYGON_RPC_URL || 'https://polygon-rpc.com', {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({
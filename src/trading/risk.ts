@@ -118,3 +118,29 @@ export function enforceExposureLimits(
 
   return null;
 }
+
+/**
+ * Validate every entry of a Polymarket batch order before any of them is
+ * risk-checked or signed, so one malformed entry rejects the whole batch.
+ * Returns a JSON error string for the first bad entry, or null.
+ */
+export function validatePolymarketBatchOrders(orders: unknown): string | null {
+  if (!Array.isArray(orders) || orders.length === 0) {
+    return JSON.stringify({ error: 'orders must be a non-empty array' });
+  }
+  for (const [i, order] of orders.entries()) {
+    const side = String(order?.side || '').toUpperCase();
+    const price = Number(order?.price);
+    const size = Number(order?.size);
+    if (!order?.token_id || (side !== 'BUY' && side !== 'SELL')) {
+      return JSON.stringify({ error: `orders[${i}]: token_id and side (BUY or SELL) are required` });
+    }
+    if (!Number.isFinite(price) || price < 0.01 || price > 0.99) {
+      return JSON.stringify({ error: `orders[${i}]: price ${order.price} out of range [0.01, 0.99]` });
+    }
+    if (!Number.isFinite(size) || size <= 0) {
+      return JSON.stringify({ error: `orders[${i}]: invalid size ${order.size}` });
+    }
+  }
+  return null;
+}
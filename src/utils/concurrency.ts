@@ -0,0 +1,113 @@
+/**
+ * Async concurrency helpers
+ *
+ * - Bounded fan-out for N+1 style API calls: run many independent requests
+ *   concurrently without opening one socket per item or tripping rate limits.
+ * - Micro-batching: coalesce individual lookups into batch-endpoint calls.
+ */
+
+/**
+ * Map over items with at most `limit` calls in flight at once.
+ * Results are returned in input order. Rejects on the first failure,
+ * like Promise.all.
+ * @param items - Inputs to map
+ * @param limit - Max concurrent calls (clamped to at least 1)
+ * @param fn - Async mapper, receives the item and its index
+ */
+export async function mapWithConcurrency<T, R>(
+  items: readonly T[],
+  limit: number,
+  fn: (item: T, index: number) => Promise<R>
+): Promise<R[]> {
+  const results = new Array<R>(items.length);
+  const workerCount = Math.min(Math.max(1, Math.floor(limit)), items.length);
+  let next = 0;
+
+  async function worker(): Promise<void> {
+    while (next < items.length) {
+      const index = next++;
+      results[index] = await fn(items[index], index);
+    }
+  }
+
+  await Promise.all(Array.from({ length: workerCount }, worker));
+  return results;
+}
+
+export interface MicroBatcherOptions<K, R> {
+  /** Flush as soon as this many distinct keys are queued (default: 50) */
+  maxBatch?: number;
+  /** Max time the first queued key waits before a flush, in ms (default: 5) */
+  maxWaitMs?: number;
+  /** Resolve a batch of distinct keys; results must align with `keys` by index */
+  execute: (keys: K[]) => Promise<R[]>;
+}
+
+export interface MicroBatcher<K, R> {
+  /** Queue a key; resolves with its result once its batch completes */
+  submit(key: K): Promise<R>;
+  /** Send whatever is queued now */
+  flush(): void;
+}
+
+/**
+ * Collect individual requests into batches: the first submit opens a short
+ * window, everything queued by the time it closes (or once `maxBatch` is
+ * reached) goes out as one `execute` call. Duplicate keys within a window
+ * share one slot. Under light load a request waits at most `maxWaitMs`.
+ */
+export function createMicroBatcher<K, R>(options: MicroBatcherOptions<K, R>): MicroBatcher<K, R> {
+  const maxBatch = Math.max(1, options.maxBatch ?? 50);
+  const maxWaitMs = options.maxWaitMs ?? 5;
+  type Waiter = { resolve: (value: R) => void; reject: (error: unknown) => void };
+  let pending = new Map<K, Waiter[]>();
+  let timer: NodeJS.Timeout | null = null;
+
+  function flush(): void {
+    if (timer) {
+      clearTimeout(timer);
+      timer = null;
+    }
+    if (pending.size === 0) return;
+
+    const batch = pending;
+    pending = new Map();
+    const keys = Array.from(batch.keys());
+
+    for (let i = 0; i < keys.length; i += maxBatch) {
+      const chunk = keys.slice(i, i + maxBatch);
+      Promise.resolve().then(() => options.execute(chunk)).then(
+        (results) => {
+          chunk.forEach((key, j) => {
+            for (const waiter of batch.get(key) || []) waiter.resolve(results[j]);
+          });
+        },
+        (error) => {
+          for (const key of chunk) {
+            for (const waiter of batch.get(key) || []) waiter.reject(error);
+          }
+        }
+      );
+    }
+  }
+
+  return {
+    submit(key: K): Promise<R> {
+      return new Promise<R>((resolve, reject) => {
+        const waiters = pending.get(key);
+        if (waiters) {
+          waiters.push({ resolve, reject });
+        } else {
+          pending.set(key, [{ resolve, reject }]);
+        }
+
+        if (pending.size >= maxBatch) {
+          flush();
+        } else if (!timer) {
+          timer = setTimeout(flush, maxWaitMs);
+        }
+      });
+    },
+    flush,
+  };
+}
@@ -87,7 +87,10 @@ function getLimiter(host: string, config: RateLimitConfig): RateLimiter {
   return limiter;
 }
 
-function parseRetryAfter(headerValue: string | null): number | null {
+/**
+ * Parse a Retry-After header (delta-seconds or HTTP date) into milliseconds.
+ */
+export function parseRetryAfter(headerValue: string | null): number | null {
   if (!headerValue) return null;
   const seconds = Number.parseInt(headerValue, 10);
   if (Number.isFinite(seconds)) return seconds * 1000;
@@ -168,14 +171,15 @@ async function fetchWithControl(
       };
       const response = await originalFetch(input, fetchInit);
       lastResponse = response;
-      if (!allowRetry) return response;
 
-      if (response.status === 429 || response.status >= 500) {
-        if (attempt >= maxAttempts) return response;
+      if (response.status === 408 || response.status === 429 || response.status >= 500) {
+        // Record the server's Retry-After even for non-retried methods, so
+        // concurrent callers to the same host back off instead of piling on.
         const retryAfter = parseRetryAfter(response.headers.get('retry-after'));
         if (retryAfter) {
           hostCooldowns.set(host, Date.now() + retryAfter);
         }
+        if (!allowRetry || attempt >= maxAttempts) return response;
         const delay = retryAfter ?? retry.calculateDelay(attempt, {
           minDelay,
           maxDelay,
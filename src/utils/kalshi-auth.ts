@@ -2,7 +2,7 @@
  * Kalshi API authentication helpers (RSA-PSS signing).
  */
 
-import { createSign, constants as cryptoConstants } from 'crypto';
+import { createPrivateKey, createSign, constants as cryptoConstants, type KeyObject } from 'crypto';
 
 export interface KalshiApiKeyAuth {
   apiKeyId: string;
@@ -27,6 +27,22 @@ export function normalizeKalshiPrivateKey(input: string): string {
   return trimmed;
 }
 
+/** Parsed private keys by PEM, so each request skips base64 + ASN.1 decoding */
+const privateKeyCache = new Map<string, KeyObject>();
+const MAX_CACHED_KEYS = 32;
+
+function getPrivateKey(privateKeyPem: string): KeyObject {
+  const cached = privateKeyCache.get(privateKeyPem);
+  if (cached) return cached;
+  const key = createPrivateKey(normalizeKalshiPrivateKey(privateKeyPem));
+  if (privateKeyCache.size >= MAX_CACHED_KEYS) {
+    const firstKey = privateKeyCache.keys().next().value;
+    if (firstKey !== undefined) privateKeyCache.delete(firstKey);
+  }
+  privateKeyCache.set(privateKeyPem, key);
+  return key;
+}
+
 export function buildKalshiSignature(
   auth: KalshiApiKeyAuth,
   method: string,
@@ -39,7 +55,7 @@ export function buildKalshiSignature(
   signer.end();
 
   const signature = signer.sign({
-    key: normalizeKalshiPrivateKey(auth.privateKeyPem),
+    key: getPrivateKey(auth.privateKeyPem),
     padding: cryptoConstants.RSA_PKCS1_PSS_PADDING,
     saltLength: cryptoConstants.RSA_PSS_SALTLEN_DIGEST,
   });
@@ -63,3 +79,28 @@ export function buildKalshiHeadersForUrl(
     'KALSHI-ACCESS-SIGNATURE': signature,
   };
 }
+
+type KalshiPortfolioWriteListener = (apiKeyId: string) => void;
+
+const portfolioWriteListeners = new Set<KalshiPortfolioWriteListener>();
+
+/**
+ * Subscribe to authenticated Kalshi writes (orders, cancels, amends) made from
+ * any module, so caches of portfolio reads can drop entries for that key.
+ * Returns an unsubscribe function.
+ */
+export function onKalshiPortfolioWrite(listener: KalshiPortfolioWriteListener): () => void {
+  portfolioWriteListeners.add(listener);
+  return () => {
+    portfolioWriteListeners.delete(listener);
+  };
+}
+
+/**
+ * Signal that a write was sent for `apiKeyId`; call after any order-changing request
+ */
+export function notifyKalshiPortfolioWrite(apiKeyId: string): void {
+  for (const listener of portfolioWriteListeners) {
+    listener(apiKeyId);
+  }
+}
@@ -243,7 +243,13 @@ export function getOrderAmounts(
 // EIP-712 HASHING
 // =============================================================================
 
+/** Domain separators by exchange contract; they depend only on constants */
+const domainSeparatorCache = new Map<string, string>();
+
 function hashDomain(contractAddress: string): string {
+  const cached = domainSeparatorCache.get(contractAddress);
+  if (cached) return cached;
+
   const typeHash = Buffer.from(keccak256(
     Buffer.from('EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)'),
   ), 'hex');
@@ -261,7 +267,9 @@ function hashDomain(contractAddress: string): string {
     Buffer.from(contractHex, 'hex'),
   ]);
 
-  return '0x' + keccak256(encoded);
+  const separator = '0x' + keccak256(encoded);
+  domainSeparatorCache.set(contractAddress, separator);
+  return separator;
 }
 
 function encodeUint256(value: string | number | bigint): string {
@@ -272,8 +280,10 @@ function encodeAddress(address: string): string {
   return address.slice(2).toLowerCase().padStart(64, '0');
 }
 
+let orderTypeHash: Buffer | null = null;
+
 function hashOrder(order: PolymarketOrder): string {
-  const typeHash = Buffer.from(keccak256(Buffer.from(ORDER_TYPE_STRING)), 'hex');
+  const typeHash = orderTypeHash ??= Buffer.from(keccak256(Buffer.from(ORDER_TYPE_STRING)), 'hex');
 
   const encoded = Buffer.concat([
     typeHash,
@@ -357,11 +367,23 @@ function generateNonce(): string {
   return (now * 1000 + nonceCounter).toString();
 }
 
+/** Signer addresses by private key, so each order skips the EC point multiplication */
+const addressCache = new Map<string, string>();
+const MAX_CACHED_ADDRESSES = 32;
+
 function deriveAddress(privateKey: string): string {
+  const cached = addressCache.get(privateKey);
+  if (cached) return cached;
   const keyHex = privateKey.startsWith('0x') ? privateKey.slice(2) : privateKey;
   const pubKey = secp256k1.getPublicKey(keyHex, false).slice(1);
   const hash = keccak256(pubKey);
-  return '0x' + hash.slice(-40);
+  const address = '0x' + hash.slice(-40);
+  if (addressCache.size >= MAX_CACHED_ADDRESSES) {
+    const oldest = addressCache.keys().next().value;
+    if (oldest !== undefined) addressCache.delete(oldest);
+  }
+  addressCache.set(privateKey, address);
+  return address;
 }
 
 // =============================================================================
@@ -0,0 +1,103 @@
+/**
+ * Short-TTL cache for public, read-only Polymarket endpoints (Gamma and the
+ * Data API).
+ *
+ * - Concurrent misses for the same URL share one request (single-flight).
+ * - When a refresh fails (network error, 429 or 5xx) the last good body can be
+ *   served, flagged as stale, for up to POLYMARKET_STALE_MAX_AGE_MS past its TTL.
+ */
+
+import { createCache } from '../cache';
+import { logger } from './logger';
+
+type PublicBody = Record<string, unknown>;
+
+/**
+ * TTLs for public read-only Polymarket data. Gamma reference data (events,
+ * markets, tags, series, sports) and leaderboards change slowly; rank and
+ * holders move with trading; open interest and live volume are near-live.
+ * Public profiles (name, bio, avatar) are edited rarely.
+ * Wallet positions, value and activity are never cached, so a user sees their
+ * own trades immediately.
+ */
+export const POLYMARKET_GAMMA_TTL_MS = 60_000;
+export const POLYMARKET_LEADERBOARD_TTL_MS = 5 * 60_000;
+export const POLYMARKET_RANK_TTL_MS = 60_000;
+export const POLYMARKET_LIVE_STATS_TTL_MS = 5_000;
+export const POLYMARKET_PROFILE_TTL_MS = 60 * 60_000;
+
+/** How long past its TTL a last-good body may be served (flagged stale) when a refresh fails */
+export const POLYMARKET_STALE_MAX_AGE_MS = 60 * 60_000;
+
+interface CachedBody {
+  data: PublicBody;
+  fetchedAt: number;
+}
+
+/** Successful public Gamma / Data API bodies, keyed by URL; each entry carries its own TTL */
+const polymarketPublicCache = createCache<string, CachedBody>({
+  name: 'polymarket-public',
+  maxSize: 2048,
+  defaultTtl: POLYMARKET_GAMMA_TTL_MS,
+});
+
+/** Public refreshes in progress, keyed by URL */
+const polymarketPublicInflight = new Map<string, Promise<PublicBody>>();
+
+/**
+ * GET a public Polymarket endpoint through a short TTL cache. Non-OK bodies
+ * are still returned to the caller but never cached. When a refresh fails
+ * (network error, 429 or 5xx) and `serveStale` is set, the last good body is
+ * returned as `{ stale: true, as_of, data }` instead of the error. Without
+ * `serveStale`, entries are dropped as soon as they go stale.
+ */
+export async function fetchPolymarketPublicCached(
+  url: string,
+  ttlMs: number = POLYMARKET_GAMMA_TTL_MS,
+  { serveStale = true }: { serveStale?: boolean } = {}
+): Promise<PublicBody> {
+  const cached = polymarketPublicCache.get(url);
+  if (cached && Date.now() - cached.fetchedAt < ttlMs) return cached.data;
+
+  // Single-flight: concurrent misses for the same URL share one request
+  const inflight = polymarketPublicInflight.get(url);
+  if (inflight) return inflight;
+  const entryTtlMs = serveStale ? ttlMs + POLYMARKET_STALE_MAX_AGE_MS : ttlMs;
+  const request = refreshPolymarketPublic(url, entryTtlMs, serveStale ? cached : undefined).finally(() => {
+    polymarketPublicInflight.delete(url);
+  });
+  polymarketPublicInflight.set(url, request);
+  return request;
+}
+
+/** Fetch and cache a public body, falling back to `stale` when the refresh fails */
+async function refreshPolymarketPublic(
+  url: string,
+  entryTtlMs: number,
+  stale: CachedBody | undefined
+): Promise<PublicBody> {
+  const staleFallback = (): PublicBody | null => {
+    if (!stale) return null;
+    logger.warn({ url, ageMs: Date.now() - stale.fetchedAt }, 'Polymarket refresh failed; serving stale data');
+    return { stale: true, as_of: new Date(stale.fetchedAt).toISOString(), data: stale.data };
+  };
+
+  let response: Response;
+  let data: PublicBody;
+  try {
+    response = await fetch(url);
+    data = await response.json() as PublicBody;
+  } catch (err) {
+    const fallback = staleFallback();
+    if (fallback) return fallback;
+    throw err;
+  }
+
+  if (response.ok) {
+    polymarketPublicCache.set(url, { data, fetchedAt: Date.now() }, entryTtlMs);
+    return data;
+  }
+  // Outages and throttling fall back; a 4xx means the request itself is wrong
+  if (response.status === 429 || response.status >= 500) return staleFallback() ?? data;
+  return data;
+}
@@ -276,58 +276,93 @@ export function getRequiredApprovals(options?: { includeNegRisk?: boolean }): Ap
 }
 
 /**
- * Check if a specific ERC-20 approval is already set.
- * Returns the current allowance in raw units.
+ * Single read-only eth_call against `latest`; returns the raw hex result.
  */
-export async function checkErc20Allowance(
-  rpcUrl: string,
-  tokenAddress: string,
-  ownerAddress: string,
-  spenderAddress: string,
-): Promise<bigint> {
-  // allowance(address owner, address spender) selector: 0xdd62ed3e
-  const data = `0xdd62ed3e${encodeAddress(ownerAddress)}${encodeAddress(spenderAddress)}`;
-
+async function ethCall(rpcUrl: string, to: string, data: string): Promise<string> {
   const res = await fetch(rpcUrl, {
     method: 'POST',
     headers: { 'Content-Type': 'application/json' },
     body: JSON.stringify({
       jsonrpc: '2.0',
       method: 'eth_call',
-      params: [{ to: tokenAddress, data }, 'latest'],
+      params: [{ to, data }, 'latest'],
       id: 1,
     }),
   });
 
   const json = (await res.json()) as { result?: string };
-  return BigInt(json.result || '0x0');
+  return json.result || '0x0';
 }
 
 /**
- * Check if ERC-1155 approval is set (isApprovedForAll).
+ * Run several eth_calls as one JSON-RPC batch POST. Results are returned in
+ * `calls` order; an error on any call rejects. Providers that don't accept
+ * batches (non-OK status or non-array reply) get one POST per call.
  */
-export async function checkErc1155Approval(
+export async function ethCallBatch(
   rpcUrl: string,
-  tokenAddress: string,
-  ownerAddress: string,
-  operatorAddress: string,
-): Promise<boolean> {
-  // isApprovedForAll(address account, address operator) selector: 0xe985e9c5
-  const data = `0xe985e9c5${encodeAddress(ownerAddress)}${encodeAddress(operatorAddress)}`;
+  calls: Array<{ to: string; data: string }>,
+): Promise<string[]> {
+  if (calls.length <= 1) {
+    return Promise.all(calls.map((call) => ethCall(rpcUrl, call.to, call.data)));
+  }
 
   const res = await fetch(rpcUrl, {
     method: 'POST',
     headers: { 'Content-Type': 'application/json' },
-    body: JSON.stringify({
+    body: JSON.stringify(calls.map((call, id) => ({
       jsonrpc: '2.0',
       method: 'eth_call',
-      params: [{ to: tokenAddress, data }, 'latest'],
-      id: 1,
-    }),
+      params: [{ to: call.to, data: call.data }, 'latest'],
+      id,
+    }))),
   });
 
-  const json = (await res.json()) as { result?: string };
-  return BigInt(json.result || '0x0') !== 0n;
+  type BatchEntry = { id: number; result?: string; error?: { code?: number; message?: string } };
+  const json = res.ok ? (await res.json().catch(() => null)) as BatchEntry[] | null : null;
+  if (!Array.isArray(json)) {
+    await res.body?.cancel().catch(() => {});
+    return Promise.all(calls.map((call) => ethCall(rpcUrl, call.to, call.data)));
+  }
+
+  // Batch responses may arrive in any order
+  const byId = new Map(json.map((entry) => [entry.id, entry]));
+  return calls.map((call, id) => {
+    const entry = byId.get(id);
+    if (entry?.error) {
+      throw new Error(`eth_call to ${call.to} failed: ${entry.error.message || `code ${entry.error.code}`}`);
+    }
+    return entry?.result || '0x0';
+  });
+}
+
+/**
+ * Check if a specific ERC-20 approval is already set.
+ * Returns the current allowance in raw units.
+ */
+export async function checkErc20Allowance(
+  rpcUrl: string,
+  tokenAddress: string,
+  ownerAddress: string,
+  spenderAddress: string,
+): Promise<bigint> {
+  // allowance(address owner, address spender) selector: 0xdd62ed3e
+  const data = `0xdd62ed3e${encodeAddress(ownerAddress)}${encodeAddress(spenderAddress)}`;
+  return BigInt(await ethCall(rpcUrl, tokenAddress, data));
+}
+
+/**
+ * Check if ERC-1155 approval is set (isApprovedForAll).
+ */
+export async function checkErc1155Approval(
+  rpcUrl: string,
+  tokenAddress: string,
+  ownerAddress: string,
+  operatorAddress: string,
+): Promise<boolean> {
+  // isApprovedForAll(address account, address operator) selector: 0xe985e9c5
+  const data = `0xe985e9c5${encodeAddress(ownerAddress)}${encodeAddress(operatorAddress)}`;
+  return BigInt(await ethCall(rpcUrl, tokenAddress, data)) !== 0n;
 }
 
 export interface ApprovalStatus {
@@ -344,35 +379,39 @@ export async function checkAllApprovals(
   walletAddress: string,
   options?: { includeNegRisk?: boolean },
 ): Promise<ApprovalStatus[]> {
-  const results: ApprovalStatus[] = [];
-
   // Minimum allowance considered "approved" (at least 1000 USDC worth = 1000 * 10^6)
   const minAllowance = 1000n * 1000000n;
 
-  // Standard ERC-20 approvals
-  const usdcToCtf = await checkErc20Allowance(rpcUrl, USDC_ADDRESS, walletAddress, CTF_ADDRESS);
-  results.push({ description: 'USDC → CTF contract', approved: usdcToCtf >= minAllowance });
-
-  const usdcToExchange = await checkErc20Allowance(rpcUrl, USDC_ADDRESS, walletAddress, CTF_EXCHANGE);
-  results.push({ description: 'USDC → CTF Exchange', approved: usdcToExchange >= minAllowance });
-
-  // Standard ERC-1155 approval
-  const ctfToExchange = await checkErc1155Approval(rpcUrl, CTF_ADDRESS, walletAddress, CTF_EXCHANGE);
-  results.push({ description: 'CTF → CTF Exchange', approved: ctfToExchange });
+  const checks: Array<{ description: string; kind: 'erc20' | 'erc1155'; token: string; spender: string }> = [
+    // Standard ERC-20 approvals
+    { description: 'USDC → CTF contract', kind: 'erc20', token: USDC_ADDRESS, spender: CTF_ADDRESS },
+    { description: 'USDC → CTF Exchange', kind: 'erc20', token: USDC_ADDRESS, spender: CTF_EXCHANGE },
+    // Standard ERC-1155 approval
+    { description: 'CTF → CTF Exchange', kind: 'erc1155', token: CTF_ADDRESS, spender: CTF_EXCHANGE },
+  ];
 
   if (options?.includeNegRisk) {
-    const usdcToAdapter = await checkErc20Allowance(rpcUrl, USDC_ADDRESS, walletAddress, NEG_RISK_ADAPTER);
-    results.push({ description: 'USDC → NegRisk Adapter', approved: usdcToAdapter >= minAllowance });
-
-    const usdcToNegExchange = await checkErc20Allowance(rpcUrl, USDC_ADDRESS, walletAddress, NEG_RISK_EXCHANGE);
-    results.push({ description: 'USDC → NegRisk Exchange', approved: usdcToNegExchange >= minAllowance });
-
-    const ctfToNegExchange = await checkErc1155Approval(rpcUrl, CTF_ADDRESS, walletAddress, NEG_RISK_EXCHANGE);
-    results.push({ description: 'CTF → NegRisk Exchange', approved: ctfToNegExchange });
-
-    const ctfToAdapter = await checkErc1155Approval(rpcUrl, CTF_ADDRESS, walletAddress, NEG_RISK_ADAPTER);
-    results.push({ description: 'CTF → NegRisk Adapter', approved: ctfToAdapter });
+    checks.push(
+      { description: 'USDC → NegRisk Adapter', kind: 'erc20', token: USDC_ADDRESS, spender: NEG_RISK_ADAPTER },
+      { description: 'USDC → NegRisk Exchange', kind: 'erc20', token: USDC_ADDRESS, spender: NEG_RISK_EXCHANGE },
+      { description: 'CTF → NegRisk Exchange', kind: 'erc1155', token: CTF_ADDRESS, spender: NEG_RISK_EXCHANGE },
+      { description: 'CTF → NegRisk Adapter', kind: 'erc1155', token: CTF_ADDRESS, spender: NEG_RISK_ADAPTER },
+    );
   }
 
+  // allowance(owner, spender) = 0xdd62ed3e, isApprovedForAll(account, operator) = 0xe985e9c5
+  const raw = await ethCallBatch(rpcUrl, checks.map((check) => ({
+    to: check.token,
+    data: `0x${check.kind === 'erc20' ? 'dd62ed3e' : 'e985e9c5'}${encodeAddress(walletAddress)}${encodeAddress(check.spender)}`,
+  })));
+
+  const results: ApprovalStatus[] = checks.map((check, i) => {
+    const value = BigInt(raw[i]);
+    return {
+      description: check.description,
+      approved: check.kind === 'erc20' ? value >= minAllowance : value !== 0n,
+    };
+  });
+
   return results;
 }
@@ -73,3 +73,25 @@ test('http does not retry on POST by default', async () => {
   assert.equal(response.status, 429);
   assert.equal(calls, 1);
 });
+
+test('http honors Retry-After from non-retried requests', async () => {
+  configureHttpClient({
+    enabled: true,
+    defaultRateLimit: { maxRequests: 100, windowMs: 1 },
+    retry: { enabled: true, maxAttempts: 3, minDelay: 10, maxDelay: 30, methods: ['GET'] },
+  });
+
+  handler = async (_input, init) => {
+    if (init?.method === 'POST') {
+      return new Response('rate limited', { status: 429, headers: { 'retry-after': '1' } });
+    }
+    return new Response('ok', { status: 200 });
+  };
+
+  const post = await fetch('https://cooldown.test/orders', { method: 'POST' });
+  assert.equal(post.status, 429);
+
+  const start = Date.now();
+  await fetch('https://cooldown.test/markets');
+  assert.ok(Date.now() - start >= 900);
+});
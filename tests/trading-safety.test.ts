@@ -330,4 +330,43 @@ describe('Portfolio Correlation', () => {
   });
 });
 
+// =============================================================================
+// BATCH ORDER VALIDATION TESTS
+// =============================================================================
+
+describe('Batch Order Validation', () => {
+  const { validatePolymarketBatchOrders } = require('../src/trading/risk');
+  const validOrder = { token_id: '123456789012345', side: 'BUY', price: 0.45, size: 10 };
+
+  it('should accept a well-formed batch', () => {
+    assert.strictEqual(validatePolymarketBatchOrders([validOrder, { ...validOrder, side: 'sell' }]), null);
+  });
+
+  it('should reject an empty or non-array batch', () => {
+    assert.ok(validatePolymarketBatchOrders([]));
+    assert.ok(validatePolymarketBatchOrders(undefined));
+  });
+
+  it('should reject the whole batch when a later entry is bad', () => {
+    const error = validatePolymarketBatchOrders([validOrder, validOrder, { ...validOrder, price: 1.5 }]);
+    assert.ok(error);
+    assert.match(JSON.parse(error).error, /^orders\[2\]: price/);
+  });
+
+  it('should reject missing side, missing token and non-positive size', () => {
+    assert.match(
+      JSON.parse(validatePolymarketBatchOrders([{ ...validOrder, side: 'HOLD' }])).error,
+      /orders\[0\]: token_id and side/
+    );
+    assert.match(
+      JSON.parse(validatePolymarketBatchOrders([{ ...validOrder, token_id: '' }])).error,
+      /orders\[0\]: token_id and side/
+    );
+    assert.match(
+      JSON.parse(validatePolymarketBatchOrders([{ ...validOrder, size: 0 }])).error,
+      /orders\[0\]: invalid size/
+    );
+  });
+});
+
 console.log('All tests defined. Run with: npm test');
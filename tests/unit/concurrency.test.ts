@@ -0,0 +1,93 @@
+/**
+ * Concurrency Utility Tests
+ *
+ * Unit tests for bounded async fan-out and micro-batching.
+ */
+
+import { describe, it } from 'node:test';
+import assert from 'node:assert';
+import { mapWithConcurrency, createMicroBatcher } from '../../src/utils/concurrency';
+
+describe('mapWithConcurrency', () => {
+  it('should preserve input order', async () => {
+    const results = await mapWithConcurrency([30, 10, 20], 3, async (ms, i) => {
+      await new Promise((resolve) => setTimeout(resolve, ms));
+      return i;
+    });
+
+    assert.deepStrictEqual(results, [0, 1, 2]);
+  });
+
+  it('should never exceed the concurrency limit', async () => {
+    let inFlight = 0;
+    let peak = 0;
+
+    await mapWithConcurrency(Array.from({ length: 12 }, (_, i) => i), 4, async () => {
+      inFlight++;
+      peak = Math.max(peak, inFlight);
+      await new Promise((resolve) => setTimeout(resolve, 5));
+      inFlight--;
+    });
+
+    assert.strictEqual(peak, 4);
+  });
+
+  it('should handle empty input', async () => {
+    const results = await mapWithConcurrency([], 5, async () => 1);
+    assert.deepStrictEqual(results, []);
+  });
+
+  it('should reject when a mapper fails', async () => {
+    await assert.rejects(
+      mapWithConcurrency([1, 2, 3], 2, async (n) => {
+        if (n === 2) throw new Error('boom');
+        return n;
+      }),
+      /boom/
+    );
+  });
+});
+
+describe('createMicroBatcher', () => {
+  it('should coalesce concurrent submits into one batch', async () => {
+    const batches: string[][] = [];
+    const batcher = createMicroBatcher<string, string>({
+      maxWaitMs: 5,
+      execute: async (keys) => {
+        batches.push(keys);
+        return keys.map((k) => k.toUpperCase());
+      },
+    });
+
+    const results = await Promise.all([batcher.submit('a'), batcher.submit('b'), batcher.submit('a')]);
+
+    assert.deepStrictEqual(results, ['A', 'B', 'A']);
+    assert.deepStrictEqual(batches, [['a', 'b']]);
+  });
+
+  it('should flush immediately when maxBatch is reached', async () => {
+    const batches: number[][] = [];
+    const batcher = createMicroBatcher<number, number>({
+      maxBatch: 2,
+      maxWaitMs: 1000,
+      execute: async (keys) => {
+        batches.push(keys);
+        return keys;
+      },
+    });
+
+    await Promise.all([batcher.submit(1), batcher.submit(2)]);
+    assert.deepStrictEqual(batches, [[1, 2]]);
+  });
+
+  it('should reject every waiter in a failed batch', async () => {
+    const batcher = createMicroBatcher<string, string>({
+      execute: async () => {
+        throw new Error('batch failed');
+      },
+    });
+
+    const results = await Promise.allSettled([batcher.submit('x'), batcher.submit('y')]);
+    assert.ok(results.every((r) => r.status === 'rejected'));
+  });
+});
@@ -0,0 +1,101 @@
+/**
+ * Kalshi Feed Tests
+ *
+ * Unit tests for coalesced market lookups over GET /markets?tickers=.
+ */
+
+import { describe, it, before, beforeEach, after } from 'node:test';
+import assert from 'node:assert';
+import { createKalshiFeed, type KalshiFeed } from '../../../src/feeds/kalshi';
+
+const realFetch = globalThis.fetch;
+const requests: string[] = [];
+let handler: (url: URL) => Response = () => Response.json({});
+
+globalThis.fetch = (async (input: string | URL | Request) => {
+  const url = new URL(String(input));
+  requests.push(url.pathname.replace('/trade-api/v2', '') + url.search);
+  return handler(url);
+}) as typeof fetch;
+
+after(() => {
+  globalThis.fetch = realFetch;
+});
+
+const rawMarket = (ticker: string) => ({ ticker, title: `Market ${ticker}`, yes_bid: 40, no_bid: 58 });
+
+/** Serve multi-ticker requests with only `listed` tickers; single lookups 404 unless in `single` */
+function kalshiApi(listed: string[], single: string[] = []) {
+  return (url: URL): Response => {
+    if (url.pathname.endsWith('/markets') && url.searchParams.has('tickers')) {
+      const wanted = url.searchParams.get('tickers')!.split(',');
+      return Response.json({ markets: wanted.filter((t) => listed.includes(t)).map(rawMarket) });
+    }
+    const ticker = url.pathname.split('/').pop()!;
+    if (single.includes(ticker)) return Response.json({ market: rawMarket(ticker) });
+    return Response.json({ error: 'not found' }, { status: 404 });
+  };
+}
+
+describe('Kalshi feed market lookups', () => {
+  let feed: KalshiFeed;
+
+  before(() => {
+    // Unauthenticated feed: no WebSocket, no signing
+    delete process.env.KALSHI_API_KEY_ID;
+    delete process.env.KALSHI_PRIVATE_KEY;
+    delete process.env.KALSHI_PRIVATE_KEY_PATH;
+  });
+
+  beforeEach(async () => {
+    requests.length = 0;
+    feed = await createKalshiFeed();
+  });
+
+  it('should coalesce concurrent lookups and give each caller its own market', async () => {
+    handler = kalshiApi(['KXA-1', 'KXB-1', 'KXC-1']);
+
+    const [a, b, c] = await Promise.all([
+      feed.getMarket('KXA-1'),
+      feed.getMarket('KXB-1'),
+      feed.getMarket('KXC-1'),
+    ]);
+
+    assert.deepStrictEqual([a?.id, b?.id, c?.id], ['KXA-1', 'KXB-1', 'KXC-1']);
+    assert.deepStrictEqual(requests, ['/markets?tickers=KXA-1%2CKXB-1%2CKXC-1&limit=3']);
+  });
+
+  it('should fall back to a single fetch for a ticker missing from the multi response', async () => {
+    handler = kalshiApi(['KXA-1', 'KXC-1'], ['KXB-1']);
+
+    const [a, b, c] = await Promise.all([
+      feed.getMarket('KXA-1'),
+      feed.getMarket('KXB-1'),
+      feed.getMarket('KXC-1'),
+    ]);
+
+    assert.deepStrictEqual([a?.id, b?.id, c?.id], ['KXA-1', 'KXB-1', 'KXC-1']);
+    assert.strictEqual(requests.length, 2);
+    assert.strictEqual(requests[1], '/markets/KXB-1');
+  });
+
+  it('should resolve an unknown ticker to null', async () => {
+    handler = kalshiApi(['KXA-1']);
+
+    const [a, missing] = await Promise.all([feed.getMarket('KXA-1'), feed.getMarket('KXNOPE-1')]);
+
+    assert.strictEqual(a?.id, 'KXA-1');
+    assert.strictEqual(missing, null);
+  });
+
+  it('should fall back to per-market requests when the multi call fails', async () => {
+    handler = (url) => url.searchParams.has('tickers')
+      ? new Response('unavailable', { status: 503 })
+      : kalshiApi([], ['KXA-1', 'KXB-1'])(url);
+
+    const [a, b] = await Promise.all([feed.getMarket('KXA-1'), feed.getMarket('KXB-1')]);
+
+    assert.deepStrictEqual([a?.id, b?.id], ['KXA-1', 'KXB-1']);
+    assert.deepStrictEqual(requests.slice(1).sort(), ['/markets/KXA-1', '/markets/KXB-1']);
+  });
+});
@@ -0,0 +1,152 @@
+/**
+ * Polymarket Feed Tests
+ *
+ * Unit tests for serving orderbooks from the WebSocket book stream and
+ * dropping them as soon as the stream reports a change.
+ */
+
+import { describe, it, before, beforeEach, after } from 'node:test';
+import assert from 'node:assert';
+import { WebSocketServer, type WebSocket } from 'ws';
+import type { AddressInfo } from 'node:net';
+import type { OrderbookUpdate } from '../../../src/types';
+import { createPolymarketFeed, type PolymarketFeed } from '../../../src/feeds/polymarket';
+import { getGlobalFreshnessTracker } from '../../../src/feeds/freshness';
+
+const TOKEN = '1234567890';
+
+const realFetch = globalThis.fetch;
+let restBookFetches = 0;
+
+// REST book (mid 0.375) is distinguishable from the streamed one (mid 0.50)
+globalThis.fetch = (async (input: string | URL | Request) => {
+  if (String(input).endsWith('/orderbook')) {
+    restBookFetches++;
+    return Response.json({ bids: [{ price: '0.25', size: '5' }], asks: [{ price: '0.50', size: '5' }] });
+  }
+  return Response.json({});
+}) as typeof fetch;
+
+describe('Polymarket feed streamed orderbooks', () => {
+  let wss: WebSocketServer;
+  let server: WebSocket;
+  let feed: PolymarketFeed;
+  let unsubscribe: () => void = () => {};
+
+  const nextEvent = (event: string) => new Promise<void>((resolve) => feed.once(event, () => resolve()));
+
+  /** Push a full book for TOKEN and wait until the feed has stored it */
+  async function pushBook(): Promise<void> {
+    const stored = nextEvent('orderbook');
+    server.send(JSON.stringify({
+      event_type: 'book',
+      asset_id: TOKEN,
+      market: '0xmarket',
+      bids: [{ price: '0.45', size: '10' }],
+      asks: [{ price: '0.55', size: '10' }],
+      timestamp: String(Date.now()),
+    }));
+    await stored;
+  }
+
+  /** Send a stream message for TOKEN and wait for the price update it produces */
+  async function pushPriceEvent(message: Record<string, unknown>): Promise<void> {
+    const handled = nextEvent('price');
+    server.send(JSON.stringify({ market: '0xmarket', timestamp: String(Date.now()), ...message }));
+    await handled;
+  }
+
+  const orderbookMid = async () => (await feed.getOrderbook('polymarket', TOKEN))?.midPrice;
+
+  before(async () => {
+    wss = new WebSocketServer({ port: 0 });
+    await new Promise<void>((resolve) => wss.on('listening', () => resolve()));
+    const wsUrl = `ws://127.0.0.1:${(wss.address() as AddressInfo).port}`;
+
+    const connected = new Promise<WebSocket>((resolve) => wss.once('connection', resolve));
+    feed = await createPolymarketFeed({ wsUrl });
+    await feed.start();
+    server = await connected;
+  });
+
+  beforeEach(async () => {
+    restBookFetches = 0;
+    const subscribed = new Promise<void>((resolve) => server.once('message', () => resolve()));
+    unsubscribe = feed.subscribePrice('polymarket', TOKEN, () => {});
+    await subscribed;
+    await pushBook();
+  });
+
+  after(async () => {
+    unsubscribe();
+    await feed.stop();
+    getGlobalFreshnessTracker().stop();
+    await new Promise<void>((resolve) => wss.close(() => resolve()));
+    globalThis.fetch = realFetch;
+  });
+
+  it('should serve the streamed book without a REST call', async () => {
+    assert.strictEqual(await orderbookMid(), 0.5);
+    assert.strictEqual(restBookFetches, 0);
+    unsubscribe();
+  });
+
+  it('should drop the streamed book on price_change', async () => {
+    await pushPriceEvent({
+      event_type: 'price_change',
+      price_changes: [{ asset_id: TOKEN, price: '0.46', best_bid: '0.46', best_ask: '0.55' }],
+    });
+
+    assert.strictEqual(await orderbookMid(), 0.375);
+    assert.strictEqual(restBookFetches, 1);
+    unsubscribe();
+  });
+
+  it('should drop the streamed book on best_bid_ask', async () => {
+    await pushPriceEvent({ event_type: 'best_bid_ask', asset_id: TOKEN, best_bid: '0.44', best_ask: '0.55' });
+
+    assert.strictEqual(await orderbookMid(), 0.375);
+    assert.strictEqual(restBookFetches, 1);
+    unsubscribe();
+  });
+
+  it('should drop the streamed book on last_trade_price', async () => {
+    await pushPriceEvent({ event_type: 'last_trade_price', asset_id: TOKEN, price: '0.55' });
+
+    assert.strictEqual(await orderbookMid(), 0.375);
+    assert.strictEqual(restBookFetches, 1);
+    unsubscribe();
+  });
+
+  it('should drop the streamed book on unsubscribe', async () => {
+    unsubscribe();
+
+    assert.strictEqual(await orderbookMid(), 0.375);
+    assert.strictEqual(restBookFetches, 1);
+  });
+
+  it('should not serve a streamed book older than 30s', async () => {
+    const realNow = Date.now;
+    Date.now = () => realNow() + 31_000;
+    try {
+      assert.strictEqual(await orderbookMid(), 0.375);
+      assert.strictEqual(restBookFetches, 1);
+    } finally {
+      Date.now = realNow;
+      unsubscribe();
+    }
+  });
+
+  it('should not let orderbook listeners alter the cached book', async () => {
+    feed.once('orderbook', (update: OrderbookUpdate) => {
+      update.bids.length = 0;
+      update.asks[0][0] = 0.99;
+    });
+    await pushBook();
+
+    const book = await feed.getOrderbook('polymarket', TOKEN);
+    assert.deepStrictEqual(book?.bids, [[0.45, 10]]);
+    assert.deepStrictEqual(book?.asks, [[0.55, 10]]);
+    unsubscribe();
+  });
+});
@@ -0,0 +1,234 @@
+/**
+ * Kalshi Execution Tests
+ *
+ * Unit tests for the retry policy on Kalshi trading requests (order
+ * placement is only replayed when Kalshi did not process the request) and
+ * for per-order results of batch cancels.
+ */
+
+import { describe, it, before, beforeEach, after } from 'node:test';
+import assert from 'node:assert';
+import { generateKeyPairSync } from 'crypto';
+import { createExecutionService, type ExecutionService } from '../../src/execution';
+
+const { privateKey } = generateKeyPairSync('rsa', {
+  modulusLength: 2048,
+  privateKeyEncoding: { type: 'pkcs8', format: 'pem' },
+  publicKeyEncoding: { type: 'spki', format: 'pem' },
+});
+
+const realFetch = globalThis.fetch;
+const requests: Array<{ method: string; path: string }> = [];
+let handler: (path: string, method: string) => Response = () => Response.json({});
+
+globalThis.fetch = (async (input: string | URL | Request, init?: RequestInit) => {
+  const url = new URL(String(input));
+  const path = url.pathname.replace('/trade-api/v2', '') + url.search;
+  const method = init?.method || 'GET';
+  requests.push({ method, path });
+  return handler(path, method);
+}) as typeof fetch;
+
+after(() => {
+  globalThis.fetch = realFetch;
+});
+
+/** A rate-limit reply that asks for an immediate retry */
+const rateLimited = () => new Response('slow down', { status: 429, headers: { 'retry-after': '0' } });
+
+/** Answer the listed statuses in turn, then `last` for every later call */
+function sequence(statuses: Array<() => Response>, last: () => Response) {
+  let i = 0;
+  return () => (i < statuses.length ? statuses[i++]() : last());
+}
+
+const countRequests = (method: string, path: string) =>
+  requests.filter((r) => r.method === method && r.path === path).length;
+
+describe('Kalshi order placement retries', () => {
+  let service: ExecutionService;
+  let orderReply: () => Response;
+
+  before(() => {
+    service = createExecutionService({ kalshi: { apiKeyId: 'test-key', privateKeyPem: privateKey } });
+  });
+
+  beforeEach(() => {
+    requests.length = 0;
+    handler = (path, method) => (method === 'POST' && path === '/portfolio/orders' ? orderReply() : Response.json({}));
+  });
+
+  after(() => {
+    service.stop();
+  });
+
+  const buy = () => service.buyLimit({ platform: 'kalshi', marketId: 'KXTEST-1', outcome: 'yes', price: 0.4, size: 5 });
+
+  it('should not resend an order after a 502', async () => {
+    orderReply = sequence(
+      [() => new Response('bad gateway', { status: 502 })],
+      () => Response.json({ order: { order_id: 'o-1', status: 'resting' } })
+    );
+
+    const result = await buy();
+
+    assert.strictEqual(result.success, false);
+    assert.strictEqual(result.error, 'HTTP 502');
+    assert.strictEqual(countRequests('POST', '/portfolio/orders'), 1);
+  });
+
+  it('should resend an order after a 429', async () => {
+    orderReply = sequence([rateLimited], () => Response.json({ order: { order_id: 'o-2', status: 'resting' } }));
+
+    const result = await buy();
+
+    assert.strictEqual(result.success, true);
+    assert.strictEqual(result.orderId, 'o-2');
+    assert.strictEqual(countRequests('POST', '/portfolio/orders'), 2);
+  });
+
+  it('should not resend an order after a network error', async () => {
+    orderReply = () => {
+      throw new Error('socket hang up');
+    };
+
+    const result = await buy();
+
+    assert.strictEqual(result.success, false);
+    assert.match(result.error ?? '', /socket hang up/);
+    assert.strictEqual(countRequests('POST', '/portfolio/orders'), 1);
+  });
+});
+
+describe('Kalshi batch order placement retries', () => {
+  let service: ExecutionService;
+  let batchReply: () => Response;
+
+  before(() => {
+    service = createExecutionService({ kalshi: { apiKeyId: 'test-key', privateKeyPem: privateKey } });
+  });
+
+  beforeEach(() => {
+    requests.length = 0;
+    handler = (path, method) => (method === 'POST' && path === '/portfolio/orders/batched' ? batchReply() : Response.json({}));
+  });
+
+  after(() => {
+    service.stop();
+  });
+
+  const orders = ['KXA-1', 'KXB-1'].map((marketId) => ({
+    platform: 'kalshi' as const,
+    marketId,
+    outcome: 'yes',
+    side: 'buy' as const,
+    price: 0.4,
+    size: 5,
+  }));
+  const placed = () => Response.json({
+    orders: [{ order_id: 'o-a', status: 'resting' }, { order_id: 'o-b', status: 'resting' }],
+  });
+
+  it('should not resend the batch after a 502', async () => {
+    batchReply = sequence([() => new Response('bad gateway', { status: 502 })], placed);
+
+    const results = await service.placeOrdersBatch(orders);
+
+    assert.deepStrictEqual(results.map((r) => [r.success, r.error]), [[false, 'HTTP 502'], [false, 'HTTP 502']]);
+    assert.strictEqual(countRequests('POST', '/portfolio/orders/batched'), 1);
+  });
+
+  it('should resend the batch after a 429', async () => {
+    batchReply = sequence([rateLimited], placed);
+
+    const results = await service.placeOrdersBatch(orders);
+
+    assert.deepStrictEqual(results.map((r) => r.orderId), ['o-a', 'o-b']);
+    assert.strictEqual(countRequests('POST', '/portfolio/orders/batched'), 2);
+  });
+});
+
+describe('Kalshi batch cancels', () => {
+  let service: ExecutionService;
+  let cancelReply: () => Response;
+
+  before(() => {
+    service = createExecutionService({ kalshi: { apiKeyId: 'test-key', privateKeyPem: privateKey } });
+  });
+
+  beforeEach(() => {
+    requests.length = 0;
+    handler = (path, method) => {
+      if (method === 'DELETE' && path === '/portfolio/orders/batched') return cancelReply();
+      if (method === 'GET' && path.startsWith('/portfolio/orders?')) {
+        return Response.json({ orders: ['o-1', 'o-2', 'o-3'].map(restingOrder) });
+      }
+      return Response.json({});
+    };
+  });
+
+  after(() => {
+    service.stop();
+  });
+
+  const restingOrder = (orderId: string) => ({
+    order_id: orderId,
+    ticker: 'KXTEST-1',
+    side: 'yes',
+    action: 'buy',
+    type: 'limit',
+    yes_price: 40,
+    no_price: 60,
+    remaining_count: 5,
+    count: 5,
+    created_time: new Date().toISOString(),
+    status: 'resting',
+  });
+  /** 200 reply in which `failed` orders carry a per-order error */
+  const cancelled = (ids: string[], failed: string[] = []) => () => Response.json({
+    orders: ids.map((id) => (failed.includes(id)
+      ? { order_id: id, error: { code: 'not_found', message: 'order not found' } }
+      : { order_id: id, order: { order_id: id, status: 'canceled' } })),
+  });
+
+  it('should report per-order errors from a 200 reply as failures', async () => {
+    cancelReply = cancelled(['o-1', 'o-2'], ['o-2']);
+
+    const results = await service.cancelOrdersBatch('kalshi', ['o-1', 'o-2']);
+
+    assert.deepStrictEqual(results, [
+      { orderId: 'o-1', success: true },
+      { orderId: 'o-2', success: false },
+    ]);
+  });
+
+  it('should retry a batch cancel after a 5xx', async () => {
+    cancelReply = sequence(
+      [() => new Response('bad gateway', { status: 502, headers: { 'retry-after': '0' } })],
+      cancelled(['o-1', 'o-2'])
+    );
+
+    const results = await service.cancelOrdersBatch('kalshi', ['o-1', 'o-2']);
+
+    assert.ok(results.every((r) => r.success));
+    assert.strictEqual(countRequests('DELETE', '/portfolio/orders/batched'), 2);
+  });
+
+  it('should fail every order in the chunk when the retries run out', async () => {
+    cancelReply = () => new Response('unavailable', { status: 503, headers: { 'retry-after': '0' } });
+
+    const results = await service.cancelOrdersBatch('kalshi', ['o-1', 'o-2']);
+
+    assert.ok(results.every((r) => !r.success));
+    assert.strictEqual(countRequests('DELETE', '/portfolio/orders/batched'), 3);
+  });
+
+  it('should only count the orders cancel-all actually cancelled', async () => {
+    cancelReply = cancelled(['o-1', 'o-2', 'o-3'], ['o-3']);
+
+    const count = await service.cancelAllOrders('kalshi');
+
+    assert.strictEqual(count, 2);
+    assert.strictEqual(countRequests('DELETE', '/portfolio/orders/batched'), 1);
+  });
+});
@@ -0,0 +1,153 @@
+/**
+ * Kalshi Handler Caching Tests
+ *
+ * Unit tests for request coalescing, the public response cache and the
+ * user-data-timestamp guard on portfolio reads.
+ */
+
+import { describe, it, beforeEach, after } from 'node:test';
+import assert from 'node:assert';
+import { generateKeyPairSync } from 'crypto';
+import { kalshiHandlers } from '../../src/agents/handlers/kalshi';
+import { notifyKalshiPortfolioWrite } from '../../src/utils/kalshi-auth';
+import type { HandlerContext } from '../../src/agents/handlers/types';
+
+const { privateKey } = generateKeyPairSync('rsa', {
+  modulusLength: 2048,
+  privateKeyEncoding: { type: 'pkcs8', format: 'pem' },
+  publicKeyEncoding: { type: 'spki', format: 'pem' },
+});
+
+const realFetch = globalThis.fetch;
+const requests: Array<{ method: string; path: string }> = [];
+let handler: (path: string, method: string) => Promise<Response> = async () => Response.json({});
+
+globalThis.fetch = (async (input: string | URL | Request, init?: RequestInit) => {
+  const url = new URL(String(input));
+  const path = url.pathname.replace('/trade-api/v2', '') + url.search;
+  const method = init?.method || 'GET';
+  requests.push({ method, path });
+  return handler(path, method);
+}) as typeof fetch;
+
+after(() => {
+  globalThis.fetch = realFetch;
+});
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
+let keySeq = 0;
+
+/** Context with Kalshi API-key credentials; a fresh key id per test isolates cache entries */
+function createContext(): { context: HandlerContext; apiKeyId: string } {
+  const apiKeyId = `test-key-${++keySeq}`;
+  const credentials = new Map([
+    ['kalshi', { platform: 'kalshi', data: { apiKeyId, privateKeyPem: privateKey } }],
+  ]);
+  const context = { db: {}, tradingContext: { credentials } } as unknown as HandlerContext;
+  return { context, apiKeyId };
+}
+
+const countRequests = (path: string) => requests.filter((r) => r.path === path).length;
+
+describe('Kalshi handler request coalescing', () => {
+  beforeEach(() => {
+    requests.length = 0;
+  });
+
+  it('should share one request between concurrent identical GETs', async () => {
+    handler = async () => {
+      await sleep(10);
+      return Response.json({ market: { ticker: 'KXTEST-1' } });
+    };
+    const { context } = createContext();
+
+    const results = await Promise.all([
+      kalshiHandlers.kalshi_market({ ticker: 'KXTEST-1' }, context),
+      kalshiHandlers.kalshi_market({ ticker: 'KXTEST-1' }, context),
+      kalshiHandlers.kalshi_market({ ticker: 'KXTEST-1' }, context),
+    ]);
+
+    assert.strictEqual(countRequests('/markets/KXTEST-1'), 1);
+    for (const r of results) assert.deepStrictEqual(JSON.parse(r), { market: { ticker: 'KXTEST-1' } });
+  });
+
+  it('should not cache error bodies', async () => {
+    const { context } = createContext();
+    handler = async () => new Response('unavailable', { status: 503, statusText: 'Service Unavailable' });
+    const failed = await kalshiHandlers.kalshi_milestone({ milestone_id: 'm-err' }, context);
+    assert.ok(JSON.parse(failed).error);
+
+    handler = async () => Response.json({ milestone: { id: 'm-err' } });
+    await kalshiHandlers.kalshi_milestone({ milestone_id: 'm-err' }, context);
+    await kalshiHandlers.kalshi_milestone({ milestone_id: 'm-err' }, context);
+
+    // The failure was retried once; the success was then served from cache
+    assert.strictEqual(countRequests('/milestones/m-err'), 2);
+  });
+});
+
+describe('Kalshi timestamp-guarded portfolio reads', () => {
+  let stamp = 'stamp-1';
+  let balance = 100;
+
+  beforeEach(() => {
+    requests.length = 0;
+    stamp = 'stamp-1';
+    balance = 100;
+    handler = async (path) => {
+      if (path === '/portfolio/user-data/timestamp') return Response.json({ last_updated_ts: stamp });
+      if (path === '/portfolio/balance') return Response.json({ balance });
+      return Response.json({});
+    };
+  });
+
+  it('should serve the cached body while the timestamp is unchanged', async () => {
+    const { context } = createContext();
+
+    await kalshiHandlers.kalshi_balance({}, context);
+    balance = 250;
+    const second = await kalshiHandlers.kalshi_balance({}, context);
+
+    assert.deepStrictEqual(JSON.parse(second), { balance: 100 });
+    assert.strictEqual(countRequests('/portfolio/balance'), 1);
+    assert.strictEqual(countRequests('/portfolio/user-data/timestamp'), 2);
+  });
+
+  it('should refetch when the timestamp changes', async () => {
+    const { context } = createContext();
+
+    await kalshiHandlers.kalshi_balance({}, context);
+    stamp = 'stamp-2';
+    balance = 250;
+    const second = await kalshiHandlers.kalshi_balance({}, context);
+
+    assert.deepStrictEqual(JSON.parse(second), { balance: 250 });
+    assert.strictEqual(countRequests('/portfolio/balance'), 2);
+  });
+
+  it('should drop cached bodies after a write through the handlers', async () => {
+    const { context } = createContext();
+
+    await kalshiHandlers.kalshi_balance({}, context);
+    await kalshiHandlers.kalshi_create_subaccount({ name: 'sub' }, context);
+    balance = 250;
+    const refreshed = await kalshiHandlers.kalshi_balance({}, context);
+
+    assert.deepStrictEqual(JSON.parse(refreshed), { balance: 250 });
+    assert.strictEqual(countRequests('/portfolio/balance'), 2);
+  });
+
+  it('should drop cached bodies when another module reports a write', async () => {
+    const { context, apiKeyId } = createContext();
+    const other = createContext();
+
+    await kalshiHandlers.kalshi_balance({}, context);
+    await kalshiHandlers.kalshi_balance({}, other.context);
+    notifyKalshiPortfolioWrite(apiKeyId);
+    await kalshiHandlers.kalshi_balance({}, context);
+    await kalshiHandlers.kalshi_balance({}, other.context);
+
+    // Only the notified account refetched its balance
+    assert.strictEqual(countRequests('/portfolio/balance'), 3);
+  });
+});
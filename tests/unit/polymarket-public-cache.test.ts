@@ -0,0 +1,120 @@
+/**
+ * Polymarket Public Cache Tests
+ *
+ * Unit tests for single-flight refreshes and stale-on-error fallback.
+ */
+
+import { describe, it, beforeEach, after } from 'node:test';
+import assert from 'node:assert';
+import { fetchPolymarketPublicCached } from '../../src/utils/polymarket-public-cache';
+
+const realFetch = globalThis.fetch;
+let calls = 0;
+let handler: (url: string) => Promise<Response> = async () => Response.json({});
+
+globalThis.fetch = (async (input: string | URL | Request) => {
+  calls++;
+  return handler(String(input));
+}) as typeof fetch;
+
+after(() => {
+  globalThis.fetch = realFetch;
+});
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
+let urlSeq = 0;
+/** Each test gets its own URL so cache entries never leak between tests */
+const nextUrl = () => `https://gamma-api.polymarket.com/test/${++urlSeq}`;
+
+describe('fetchPolymarketPublicCached', () => {
+  beforeEach(() => {
+    calls = 0;
+  });
+
+  it('should share one request between concurrent misses', async () => {
+    const url = nextUrl();
+    handler = async () => {
+      await sleep(10);
+      return Response.json({ id: 1 });
+    };
+
+    const results = await Promise.all([
+      fetchPolymarketPublicCached(url),
+      fetchPolymarketPublicCached(url),
+      fetchPolymarketPublicCached(url),
+    ]);
+
+    assert.strictEqual(calls, 1);
+    for (const r of results) assert.deepStrictEqual(r, { id: 1 });
+  });
+
+  it('should serve a fresh body from cache', async () => {
+    const url = nextUrl();
+    handler = async () => Response.json({ id: 2 });
+
+    await fetchPolymarketPublicCached(url, 1000);
+    const second = await fetchPolymarketPublicCached(url, 1000);
+
+    assert.strictEqual(calls, 1);
+    assert.deepStrictEqual(second, { id: 2 });
+  });
+
+  it('should not cache error bodies', async () => {
+    const url = nextUrl();
+    handler = async () => Response.json({ error: 'bad' }, { status: 500 });
+    await fetchPolymarketPublicCached(url);
+
+    handler = async () => Response.json({ id: 3 });
+    const result = await fetchPolymarketPublicCached(url);
+
+    assert.strictEqual(calls, 2);
+    assert.deepStrictEqual(result, { id: 3 });
+  });
+
+  it('should serve the last good body, flagged stale, when a refresh fails', async () => {
+    const url = nextUrl();
+    handler = async () => Response.json({ id: 4 });
+    await fetchPolymarketPublicCached(url, 10);
+    await sleep(20);
+
+    handler = async () => new Response('unavailable', { status: 503 });
+    const onOutage = await fetchPolymarketPublicCached(url, 10);
+    assert.strictEqual(onOutage.stale, true);
+    assert.deepStrictEqual(onOutage.data, { id: 4 });
+    assert.strictEqual(typeof onOutage.as_of, 'string');
+
+    handler = async () => {
+      throw new Error('socket hang up');
+    };
+    const onNetworkError = await fetchPolymarketPublicCached(url, 10);
+    assert.strictEqual(onNetworkError.stale, true);
+  });
+
+  it('should return a 4xx body instead of stale data', async () => {
+    const url = nextUrl();
+    handler = async () => Response.json({ id: 5 });
+    await fetchPolymarketPublicCached(url, 10);
+    await sleep(20);
+
+    handler = async () => Response.json({ error: 'not found' }, { status: 404 });
+    const result = await fetchPolymarketPublicCached(url, 10);
+
+    assert.deepStrictEqual(result, { error: 'not found' });
+  });
+
+  it('should never serve stale data when serveStale is off', async () => {
+    const url = nextUrl();
+    handler = async () => Response.json({ id: 6 });
+    await fetchPolymarketPublicCached(url, 10, { serveStale: false });
+    await sleep(20);
+
+    handler = async () => Response.json({ error: 'unavailable' }, { status: 503 });
+    const onOutage = await fetchPolymarketPublicCached(url, 10, { serveStale: false });
+    assert.deepStrictEqual(onOutage, { error: 'unavailable' });
+
+    handler = async () => {
+      throw new Error('socket hang up');
+    };
+    await assert.rejects(fetchPolymarketPublicCached(url, 10, { serveStale: false }), /socket hang up/);
+  });
+});
@@ -0,0 +1,136 @@
+/**
+ * Polymarket Setup Tests
+ *
+ * Unit tests for batched eth_call reads and the approval check built on them.
+ */
+
+import { describe, it, beforeEach, after } from 'node:test';
+import assert from 'node:assert';
+import {
+  ethCallBatch,
+  checkAllApprovals,
+  CTF_ADDRESS,
+  USDC_ADDRESS,
+} from '../../src/utils/polymarket-setup';
+
+type RpcRequest = { id: number; method: string; params: [{ to: string; data: string }, string] };
+
+const RPC_URL = 'https://rpc.test';
+const WALLET = '0x1111111111111111111111111111111111111111';
+
+const realFetch = globalThis.fetch;
+const posts: unknown[] = [];
+let handler: (body: RpcRequest | RpcRequest[]) => Response = () => Response.json([]);
+
+globalThis.fetch = (async (_input: string | URL | Request, init?: RequestInit) => {
+  const body = JSON.parse(String(init?.body));
+  posts.push(body);
+  return handler(body);
+}) as typeof fetch;
+
+after(() => {
+  globalThis.fetch = realFetch;
+});
+
+/** Answer a batch in reverse order, deriving each result from its call */
+function reversedBatch(resultFor: (call: RpcRequest) => string) {
+  return (body: RpcRequest | RpcRequest[]) => {
+    const batch = Array.isArray(body) ? body : [body];
+    const replies = batch.map((call) => ({ jsonrpc: '2.0', id: call.id, result: resultFor(call) }));
+    return Response.json(Array.isArray(body) ? replies.reverse() : replies[0]);
+  };
+}
+
+const hex = (n: bigint) => `0x${n.toString(16).padStart(64, '0')}`;
+
+describe('ethCallBatch', () => {
+  beforeEach(() => {
+    posts.length = 0;
+  });
+
+  it('should map out-of-order replies back to their calls', async () => {
+    handler = reversedBatch((call) => hex(BigInt(call.params[0].data.length)));
+    const calls = [
+      { to: USDC_ADDRESS, data: '0x01' },
+      { to: USDC_ADDRESS, data: '0x0102' },
+      { to: CTF_ADDRESS, data: '0x010203' },
+    ];
+
+    const results = await ethCallBatch(RPC_URL, calls);
+
+    assert.strictEqual(posts.length, 1);
+    assert.deepStrictEqual(results, [hex(4n), hex(6n), hex(8n)]);
+  });
+
+  it('should reject when any call in the batch returns an error', async () => {
+    handler = (body) => Response.json((body as RpcRequest[]).map((call) => (
+      call.id === 1
+        ? { jsonrpc: '2.0', id: call.id, error: { code: -32000, message: 'execution reverted' } }
+        : { jsonrpc: '2.0', id: call.id, result: hex(1n) }
+    )));
+
+    await assert.rejects(
+      ethCallBatch(RPC_URL, [
+        { to: USDC_ADDRESS, data: '0x01' },
+        { to: CTF_ADDRESS, data: '0x02' },
+      ]),
+      /execution reverted/
+    );
+  });
+
+  it('should fall back to single calls when the batch reply is not an array', async () => {
+    handler = (body) => Array.isArray(body)
+      ? Response.json({ jsonrpc: '2.0', id: null, error: { code: -32600, message: 'batch not supported' } })
+      : Response.json({ jsonrpc: '2.0', id: body.id, result: hex(BigInt(body.params[0].data.length)) });
+
+    const results = await ethCallBatch(RPC_URL, [
+      { to: USDC_ADDRESS, data: '0x01' },
+      { to: CTF_ADDRESS, data: '0x0102' },
+    ]);
+
+    assert.strictEqual(posts.length, 3);
+    assert.deepStrictEqual(results, [hex(4n), hex(6n)]);
+  });
+
+  it('should fall back to single calls when the batch request fails', async () => {
+    handler = (body) => Array.isArray(body)
+      ? new Response('bad gateway', { status: 502 })
+      : Response.json({ jsonrpc: '2.0', id: body.id, result: hex(7n) });
+
+    const results = await ethCallBatch(RPC_URL, [
+      { to: USDC_ADDRESS, data: '0x01' },
+      { to: CTF_ADDRESS, data: '0x02' },
+    ]);
+
+    assert.strictEqual(posts.length, 3);
+    assert.deepStrictEqual(results, [hex(7n), hex(7n)]);
+  });
+});
+
+describe('checkAllApprovals', () => {
+  beforeEach(() => {
+    posts.length = 0;
+  });
+
+  it('should report each approval from a single batched request', async () => {
+    const ctfSpender = CTF_ADDRESS.slice(2).toLowerCase();
+    // USDC -> CTF is approved, USDC -> CTF Exchange is not, CTF -> CTF Exchange is approved
+    handler = reversedBatch((call) => {
+      const isErc20 = call.params[0].data.startsWith('0xdd62ed3e');
+      if (!isErc20) return hex(1n);
+      return call.params[0].data.endsWith(ctfSpender) ? hex(10_000n * 1_000_000n) : hex(0n);
+    });
+
+    const statuses = await checkAllApprovals(RPC_URL, WALLET);
+
+    assert.strictEqual(posts.length, 1);
+    assert.deepStrictEqual(
+      statuses.map((s) => [s.description, s.approved]),
+      [
+        ['USDC → CTF contract', true],
+        ['USDC → CTF Exchange', false],
+        ['CTF → CTF Exchange', true],
+      ]
+    );
+  });
+});
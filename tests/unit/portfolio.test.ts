@@ -0,0 +1,120 @@
+/**
+ * Portfolio Tests
+ *
+ * Unit tests for Kalshi position pricing over GET /markets?tickers= and the
+ * bounded per-market fallback.
+ */
+
+import { describe, it, beforeEach, after } from 'node:test';
+import assert from 'node:assert';
+import { generateKeyPairSync } from 'crypto';
+import { createPortfolioService } from '../../src/portfolio';
+
+const { privateKey } = generateKeyPairSync('rsa', {
+  modulusLength: 2048,
+  privateKeyEncoding: { type: 'pkcs8', format: 'pem' },
+  publicKeyEncoding: { type: 'spki', format: 'pem' },
+});
+
+const realFetch = globalThis.fetch;
+const requests: URL[] = [];
+let inflight = 0;
+let maxInflight = 0;
+let handler: (url: URL) => Response = () => Response.json({});
+
+globalThis.fetch = (async (input: string | URL | Request) => {
+  const url = new URL(String(input));
+  requests.push(url);
+  inflight++;
+  maxInflight = Math.max(maxInflight, inflight);
+  try {
+    await new Promise((resolve) => setTimeout(resolve, 1));
+    return handler(url);
+  } finally {
+    inflight--;
+  }
+}) as typeof fetch;
+
+after(() => {
+  globalThis.fetch = realFetch;
+});
+
+const tickersFor = (n: number) => Array.from({ length: n }, (_, i) => `KXT-${i}`);
+const rawMarket = (ticker: string) => ({ ticker, yes_bid: 60, no_bid: 38 });
+
+/** Kalshi API holding one long YES position (avg 50c) per ticker */
+function kalshiApi(tickers: string[], opts: { listed?: string[]; multiStatus?: number } = {}) {
+  const listed = opts.listed ?? tickers;
+  return (url: URL): Response => {
+    const path = url.pathname.replace('/trade-api/v2', '');
+    if (path === '/portfolio/positions') {
+      return Response.json({
+        market_positions: tickers.map((market_id) => ({
+          market_id,
+          position: 10,
+          average_price: 50,
+          resting_orders_count: 0,
+          realized_pnl: 0,
+          total_cost: 500,
+        })),
+      });
+    }
+    if (path === '/markets') {
+      if (opts.multiStatus) return new Response('slow down', { status: opts.multiStatus });
+      const wanted = url.searchParams.get('tickers')!.split(',');
+      return Response.json({ markets: wanted.filter((t) => listed.includes(t)).map(rawMarket) });
+    }
+    const ticker = path.split('/').pop()!;
+    if (listed.includes(ticker)) return Response.json({ market: rawMarket(ticker) });
+    return Response.json({ error: 'not found' }, { status: 404 });
+  };
+}
+
+const multiRequests = () => requests.filter((u) => u.pathname.endsWith('/markets'));
+const singleRequests = () => requests.filter((u) => /\/markets\/[^/]+$/.test(u.pathname));
+
+describe('Kalshi position pricing', () => {
+  const portfolio = createPortfolioService({ kalshi: { apiKeyId: 'test-key', privateKeyPem: privateKey } });
+
+  beforeEach(() => {
+    requests.length = 0;
+    maxInflight = 0;
+  });
+
+  it('should price positions with one multi-ticker request per 100 tickers', async () => {
+    const tickers = tickersFor(150);
+    handler = kalshiApi(tickers);
+
+    const positions = await portfolio.fetchPositions();
+
+    assert.strictEqual(positions.length, 150);
+    assert.ok(positions.every((p) => p.currentPrice === 0.6));
+    assert.deepStrictEqual(
+      multiRequests().map((u) => u.searchParams.get('tickers')!.split(',').length),
+      [100, 50]
+    );
+    assert.strictEqual(singleRequests().length, 0);
+  });
+
+  it('should fetch tickers missing from the multi response one by one', async () => {
+    const tickers = tickersFor(3);
+    handler = kalshiApi(tickers, { listed: ['KXT-0', 'KXT-2'] });
+
+    const positions = await portfolio.fetchPositions();
+
+    assert.deepStrictEqual(singleRequests().map((u) => u.pathname.split('/').pop()), ['KXT-1']);
+    // KXT-1 is not listed anywhere, so it keeps its average price
+    assert.deepStrictEqual(positions.map((p) => p.currentPrice), [0.6, 0.5, 0.6]);
+  });
+
+  it('should bound the per-market fallback when the multi request is rate limited', async () => {
+    const tickers = tickersFor(40);
+    handler = kalshiApi(tickers, { multiStatus: 429 });
+
+    const positions = await portfolio.fetchPositions();
+
+    assert.strictEqual(singleRequests().length, 40);
+    assert.ok(positions.every((p) => p.currentPrice === 0.6));
+    assert.ok(maxInflight <= 4, `expected at most 4 requests in flight, saw ${maxInflight}`);
+  });
+});